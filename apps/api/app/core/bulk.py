@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.schemas.bulk import BulkDeleteResult, BulkItemError, BulkResult
+
+def check_batch_size(items: list):
+    if not items:
+        raise HTTPException(status_code=422, detail="Bulk request must contain at least one item")
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Bulk requests are limited to {settings.BULK_MAX_ITEMS} items")
+
+def _integrity_detail(error: IntegrityError) -> str:
+    return str(error.orig).splitlines()[0]
+
+def _by_id(db: Session, model, ids, options=()):
+    """Load rows by primary key in one query, returned in ``ids`` order"""
+    query = select(model).where(model.id.in_(ids)).options(*options).execution_options(populate_existing=True)
+    rows = {row.id: row for row in db.scalars(query)}
+    return [rows[row_id] for row_id in ids if row_id in rows]
+
+def bulk_insert(db: Session, model, schema, rows: List[dict], rejected: Optional[Dict[int, str]] = None, options=(),
+                after_write=None):
+    """INSERT ... RETURNING every accepted row in a single transaction.
+
+    The whole batch is sent as one multi-row statement. If it violates a
+    constraint, the batch is replayed row by row inside SAVEPOINTs so only
+    the offending items are reported and the rest still commit.
+    ``rejected`` maps request indexes to errors found before inserting.
+    ``after_write(db, rows)`` runs before the commit with the written
+    rows' values plus their new ``id``.
+    """
+    rejected = rejected or {}
+    errors = [BulkItemError(index=index, detail=detail) for index, detail in rejected.items()]
+    pending = [(index, row) for index, row in enumerate(rows) if index not in rejected]
+    statement = insert(model).returning(model, sort_by_parameter_order=True)
+
+    created, written = [], []
+    if pending:
+        try:
+            created = list(db.scalars(statement, [row for _, row in pending]))
+            written = [{**row, "id": obj.id} for (_, row), obj in zip(pending, created)]
+        except IntegrityError:
+            db.rollback()
+            for index, row in pending:
+                try:
+                    with db.begin_nested():
+                        created.append(db.scalars(statement, [row]).one())
+                    written.append({**row, "id": created[-1].id})
+                except IntegrityError as error:
+                    errors.append(BulkItemError(index=index, detail=_integrity_detail(error)))
+        if after_write and written:
+            after_write(db, written)
+        db.commit()
+
+    if options:
+        created = _by_id(db, model, [row.id for row in created], options)
+    return BulkResult[schema](
+        items=[schema.model_validate(row) for row in created],
+        errors=sorted(errors, key=lambda error: error.index),
+    )
+
+def bulk_update(db: Session, model, schema, rows: List[dict], not_found: str,
+                rejected: Optional[Dict[int, str]] = None, options=(), after_write=None):
+    """Executemany UPDATE by primary key in a single transaction.
+
+    Each row must carry ``id``; ids that don't exist are reported with
+    ``not_found``. Constraint violations fall back to per-row SAVEPOINTs
+    like ``bulk_insert``, and ``after_write`` gets the rows that were applied.
+    """
+    rejected = dict(rejected or {})
+    existing = set(db.scalars(select(model.id).where(model.id.in_([row["id"] for row in rows]))))
+    for index, row in enumerate(rows):
+        if index not in rejected and row["id"] not in existing:
+            rejected[index] = not_found
+    errors = [BulkItemError(index=index, id=rows[index]["id"], detail=detail) for index, detail in rejected.items()]
+    pending = [(index, row) for index, row in enumerate(rows) if index not in rejected]
+
+    written = []
+    if pending:
+        try:
+            db.execute(update(model), [row for _, row in pending])
+            written = [row for _, row in pending]
+        except IntegrityError:
+            db.rollback()
+            for index, row in pending:
+                try:
+                    with db.begin_nested():
+                        db.execute(update(model), [row])
+                    written.append(row)
+                except IntegrityError as error:
+                    errors.append(BulkItemError(index=index, id=row["id"], detail=_integrity_detail(error)))
+        if after_write and written:
+            after_write(db, written)
+        db.commit()
+
+    updated = _by_id(db, model, list(dict.fromkeys(row["id"] for row in written)), options)
+    return BulkResult[schema](
+        items=[schema.model_validate(row) for row in updated],
+        errors=sorted(errors, key=lambda error: error.index),
+    )
+
+def bulk_delete(db: Session, model, ids: List[int], not_found: str, children=()):
+    """DELETE ... RETURNING id for every requested id in a single statement.
+
+    ``children`` are ``(child_model, foreign_key_column)`` pairs deleted first,
+    since bulk statements bypass ORM cascades.
+    """
+    for child, foreign_key in children:
+        db.execute(delete(child).where(foreign_key.in_(ids)))
+    deleted = set(db.scalars(delete(model).where(model.id.in_(ids)).returning(model.id)))
+    db.commit()
+    return BulkDeleteResult(
+        deleted=[row_id for row_id in dict.fromkeys(ids) if row_id in deleted],
+        errors=[
+            BulkItemError(index=index, id=row_id, detail=not_found)
+            for index, row_id in enumerate(ids) if row_id not in deleted
+        ],
+    )
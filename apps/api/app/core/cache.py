@@ -0,0 +1,247 @@
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import wraps
+from typing import Any, Dict, List, NamedTuple, Optional
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.pagination import Page
+from app.core.timing import request_timing
+
+_MISSING = object()
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache for public GET responses.
+
+    Entries are tagged with the collections they were built from so that
+    write handlers can drop every dependent entry with ``invalidate``. A
+    cache created with a ``parent`` is invalidated along with it, and
+    ``listeners`` are told about every invalidation made in this process
+    (app.core.cache_sync shares them with the other workers).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int, parent: Optional["ResponseCache"] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, tags, value)
+        self._generations = {}  # tag -> bumped on every invalidation
+        self._invalidated = {}  # tag -> wall-clock time of the last invalidation
+        self._lock = threading.Lock()
+        self._children = []
+        self.listeners = []  # callables taking the invalidated tags
+        if parent is not None:
+            parent._children.append(self)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def generation(self, tags):
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def last_invalidated(self, tags) -> Optional[datetime]:
+        with self._lock:
+            return max(filter(None, map(self._invalidated.get, tags)), default=None)
+
+    def set(self, key, value, tags, generation=None):
+        with self._lock:
+            # A write landed while the value was being loaded: don't store stale data
+            if generation is not None and generation != tuple(self._generations.get(tag, 0) for tag in tags):
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, frozenset(tags), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *tags, notify: bool = True):
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                self._invalidated[tag] = now
+            stale = [key for key, entry in self._entries.items() if entry[1].intersection(tags)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+        for child in self._children:
+            child.invalidate(*tags, notify=False)
+        if notify:
+            for listener in self.listeners:
+                listener(tags)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        for child in self._children:
+            child.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": settings.RESPONSE_CACHE_ENABLED,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+search_cache = ResponseCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    parent=response_cache,
+)
+
+
+class CachedResponse(NamedTuple):
+    content: object  # validated schema, or rendered JSON bytes in raw mode
+    etag: str
+    last_modified: Optional[datetime]
+    extra_headers: Optional[dict] = None  # e.g. the pagination cursor
+
+    @property
+    def headers(self):
+        headers = {"ETag": self.etag, "Cache-Control": settings.HTTP_CACHE_CONTROL, **(self.extra_headers or {})}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Field-projected pages are dicts the route's schema already serialized (see keyset_paginate)
+_projected_adapter = TypeAdapter(List[Dict[str, Any]])
+
+def _render(adapter, result, last_modified=None):
+    timing = request_timing.get()
+    if timing is None:
+        return _render_entry(adapter, result, last_modified)
+    start = time.perf_counter()
+    try:
+        return _render_entry(adapter, result, last_modified)
+    finally:
+        timing.serialize += time.perf_counter() - start
+
+def _render_entry(adapter, result, last_modified):
+    extra_headers, raw = None, settings.RESPONSE_CACHE_RAW_JSON
+    if isinstance(result, Page):
+        extra_headers = result.headers
+        if result.fields:
+            adapter, raw = _projected_adapter, True
+        result = result.items
+
+    value = adapter.validate_python(result, from_attributes=True)
+    body = adapter.dump_json(value)
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+    return CachedResponse(body if raw else value, etag, last_modified, extra_headers)
+
+
+def is_not_modified(request: Request, entry: CachedResponse, tags=(), cache: ResponseCache = response_cache) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against a cached entry"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or entry.etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and entry.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates drop the fraction of a second: a copy dated the same
+        # second as a later invalidation may predate it
+        invalidated = cache.last_invalidated(tags)
+        return entry.last_modified <= since and (invalidated is None or invalidated < since)
+    return False
+
+
+def cached(*tags, schema, cache: ResponseCache = response_cache):
+    """Serve a GET handler from ``cache`` with conditional GET support.
+
+    The key is the handler plus its query/path parameters; the handler
+    result is validated into ``schema`` once and stored until the TTL
+    expires or one of ``tags`` is invalidated. With
+    ``RESPONSE_CACHE_RAW_JSON`` the stored value is the rendered JSON body,
+    returned as a raw ``Response`` so hits bypass response_model validation.
+
+    Every response carries a strong ETag (hash of the body); matching
+    If-None-Match requests get an empty 304. Cached responses also carry a
+    Last-Modified of when the entry was filled, since the newest
+    ``updated_at`` doesn't move when a row is deleted, for
+    If-Modified-Since.
+    """
+    adapter = TypeAdapter(schema)
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, _request: Request, _response: Response, **kwargs):
+            entry = _MISSING
+            if settings.RESPONSE_CACHE_ENABLED:
+                params = tuple(sorted(
+                    (name, _freeze(value)) for name, value in kwargs.items()
+                    if not isinstance(value, (Session, AsyncSession))
+                ))
+                key = (func.__module__, func.__name__, params)
+                entry = cache.get(key)
+                if entry is _MISSING:
+                    generation = cache.generation(tags)
+                    filled_at = datetime.now(timezone.utc).replace(microsecond=0)
+                    entry = _render(adapter, await func(*args, **kwargs), filled_at)
+                    cache.set(key, entry, tags, generation)
+            else:
+                entry = _render(adapter, await func(*args, **kwargs))
+
+            if is_not_modified(_request, entry, tags, cache):
+                return Response(status_code=304, headers=entry.headers)
+            if isinstance(entry.content, bytes):
+                return Response(content=entry.content, media_type="application/json", headers=entry.headers)
+            _response.headers.update(entry.headers)
+            return entry.content
+
+        # Let FastAPI inject the request/response objects the wrapper needs
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+    return decorator
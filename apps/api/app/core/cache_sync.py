@@ -0,0 +1,145 @@
+"""
+Cross-process invalidation for the in-process response caches.
+
+Each worker process (and each container) has its own ``response_cache``, and
+a write only invalidates the one in the worker that handled it. ``CacheSync``
+shares invalidations through the ``cache_generations`` table: a local
+invalidation bumps its tags' rows, and every worker reads the table back
+every ``RESPONSE_CACHE_SYNC_SECONDS``, dropping the entries of tags another
+process bumped. Other workers therefore serve a stale body (and ETag) for at
+most about that long, rather than until the cache TTL expires.
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import suppress
+from typing import Dict, Optional, Set
+from sqlalchemy import insert, select, update
+from starlette.concurrency import run_in_threadpool
+from app.core.cache import ResponseCache, response_cache
+from app.core.config import settings
+from app.core.database import engine, read_router
+from app.models.cache_generation import CacheGeneration
+
+logger = logging.getLogger(__name__)
+
+class CacheSync:
+    """Publishes this process's invalidations of ``cache`` and applies everyone else's.
+
+    Publishing happens as soon as possible after the write, from a background
+    task, so the write request never waits for it. Tags another process
+    bumped also start this worker's replica sticky window, so its reads
+    don't refill the cache from a replica that hasn't replayed the write.
+    """
+
+    def __init__(self, cache: ResponseCache, interval: float):
+        self.cache = cache
+        self.interval = interval
+        self._pending: Set[str] = set()  # invalidated here, not yet published
+        self._generations: Dict[str, int] = {}  # as last read from the table
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.applied = 0
+        self.errors = 0
+        cache.listeners.append(self._on_invalidate)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _on_invalidate(self, tags):
+        if not self.running:
+            return
+        with self._lock:
+            self._pending.update(tags)
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        try:
+            # Starting point: only later bumps invalidate anything here
+            self._generations = await run_in_threadpool(self._read)
+        except Exception:
+            self.errors += 1
+            logger.warning("Can't read cache_generations; is the schema migrated?", exc_info=True)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop polling and publish the invalidations still pending"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        with self._lock:
+            tags, self._pending = self._pending, set()
+        if tags:
+            try:
+                await run_in_threadpool(self._publish, tags)
+            except Exception:
+                logger.warning("Failed to publish cache invalidations for %s", sorted(tags), exc_info=True)
+
+    async def _run(self):
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            self._wake.clear()
+            try:
+                await run_in_threadpool(self._sync)
+            except Exception:
+                self.errors += 1
+                logger.warning("Cache sync failed", exc_info=True)
+
+    def _sync(self):
+        with self._lock:
+            tags, self._pending = self._pending, set()
+        if tags:
+            try:
+                self._publish(tags)
+            except Exception:
+                # Try again next round
+                with self._lock:
+                    self._pending |= tags
+                raise
+        generations = self._read()
+        # Includes this process's own bumps: invalidating those again is harmless
+        changed = [tag for tag, generation in generations.items() if generation != self._generations.get(tag)]
+        self._generations = generations
+        if changed:
+            self.cache.invalidate(*changed, notify=False)
+            read_router.mark_write()
+            self.applied += 1
+
+    def _publish(self, tags: Set[str]):
+        # Sorted, so concurrent publishers lock the rows in the same order
+        with engine.begin() as connection:
+            for tag in sorted(tags):
+                bumped = connection.execute(
+                    update(CacheGeneration).where(CacheGeneration.tag == tag).values(generation=CacheGeneration.generation + 1)
+                ).rowcount
+                if not bumped:
+                    # First write to this tag; a concurrent insert fails the round, which is retried
+                    connection.execute(insert(CacheGeneration).values(tag=tag, generation=1))
+        self.published += len(tags)
+
+    def _read(self) -> Dict[str, int]:
+        with engine.connect() as connection:
+            return dict(connection.execute(select(CacheGeneration.tag, CacheGeneration.generation)).all())
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.running,
+            "interval_seconds": self.interval,
+            "pending": len(self._pending),
+            "published": self.published,
+            "applied": self.applied,
+            "errors": self.errors,
+        }
+
+cache_sync = CacheSync(response_cache, settings.RESPONSE_CACHE_SYNC_SECONDS)
@@ -1,10 +1,109 @@
 from pydantic_settings import BaseSettings
+from typing import List, Literal, Optional
 import os
 
 class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./test.db")
+    # Use SQLAlchemy's asyncio engine (asyncpg / aiosqlite) instead of the threadpool
+    DATABASE_ASYNC: bool = False
+
+    # Read replicas behind get_read_db (GET routes), comma-separated; get_db and so
+    # every write always use DATABASE_URL. Empty: reads go to DATABASE_URL too
+    DATABASE_REPLICA_URLS: str = ""
+    DATABASE_REPLICA_POLICY: Literal["round_robin", "least_connections"] = "round_robin"
+    DATABASE_REPLICA_RETRY_SECONDS: float = 30.0  # a replica that failed to connect is skipped this long
+    # Reads stay on the primary this long after a write in the same worker (or, through
+    # the cache sync, in another one), so the cache entries the write invalidated
+    # aren't refilled from a lagging replica
+    DATABASE_REPLICA_STICKY_SECONDS: float = 5.0
+
+    # Postgres lock_timeout for schema migrations: a DDL statement stuck behind a
+    # long query fails fast instead of queueing every request behind its lock
+    MIGRATION_LOCK_TIMEOUT_MS: int = 5000
+
+    # Connection pool, per engine and per worker process: size it so that
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays under Postgres max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 keeps connections forever
+    DB_POOL_PRE_PING: bool = True
+
+    # In-process cache for public GET routes (invalidated by writes). Every worker
+    # process has its own; a write reaches the other workers' caches through the
+    # cache_generations table within RESPONSE_CACHE_SYNC_SECONDS (0: never, so they
+    # serve stale bodies until the TTL; only safe with a single worker)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    RESPONSE_CACHE_SYNC_SECONDS: float = 1.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    # /search gets its own, smaller cache: free-text queries would otherwise evict the collections
+    SEARCH_CACHE_MAX_ENTRIES: int = 64
+    # Store rendered JSON bytes and serve them as-is, skipping ORM + Pydantic on hits
+    RESPONSE_CACHE_RAW_JSON: bool = True
+    # Sent with ETag/Last-Modified; no-cache makes clients revalidate (cheap 304s)
+    HTTP_CACHE_CONTROL: str = "no-cache"
+
+    # Keyset pagination on list endpoints
+    PAGINATION_DEFAULT_LIMIT: int = 100
+    PAGINATION_MAX_LIMIT: int = 500
+
+    # Largest batch accepted by the /bulk endpoints
+    BULK_MAX_ITEMS: int = 1000
+
+    # POST /contacts/ enqueues and answers 202; a background task writes in batches
+    CONTACT_QUEUE_ENABLED: bool = False
+    CONTACT_QUEUE_MAX_SIZE: int = 10000  # beyond this, submissions get 503 + Retry-After
+    CONTACT_QUEUE_BATCH_SIZE: int = 500
+    CONTACT_QUEUE_FLUSH_SECONDS: float = 0.05  # longest a queued row waits for its batch
+    # A failed batch is retried (doubling the delay), then written row by row
+    CONTACT_QUEUE_RETRIES: int = 2
+    CONTACT_QUEUE_RETRY_SECONDS: float = 0.5
+
+    # Abuse protection for POST /contacts/: token buckets (burst, refill per minute)
+    # per client IP and per sender email, plus a window dropping identical re-posts
+    CONTACT_RATE_LIMIT_ENABLED: bool = True
+    CONTACT_IP_BURST: int = 10
+    CONTACT_IP_PER_MINUTE: float = 10  # 0 disables the per-IP limit
+    CONTACT_EMAIL_BURST: int = 5
+    CONTACT_EMAIL_PER_MINUTE: float = 2  # 0 disables the per-email limit
+    CONTACT_DEDUPE_WINDOW_SECONDS: int = 600  # 0 disables dedupe
+    RATE_LIMIT_MAX_KEYS: int = 100000  # LRU bound on tracked IPs/emails/fingerprints
+    # Share limits across workers through Redis (needs the optional 'redis' package)
+    RATE_LIMIT_REDIS_URL: Optional[str] = None
+
+    # Per-request phase timings (sql, orm, serialize, handler) as a Server-Timing
+    # header and histograms on GET /metrics; off means nothing is installed
+    REQUEST_TIMING_ENABLED: bool = False
+    REQUEST_TIMING_HEADER: bool = True  # False keeps the histograms but hides timings from clients
+
+    # N+1 detector for development and tests: counts lazy relationship loads per
+    # request; past LAZY_LOAD_THRESHOLD loads of one relationship, "warn" logs the
+    # route and "raise" fails the request (and so the test exercising it)
+    LAZY_LOAD_GUARD: Literal["off", "warn", "raise"] = "off"
+    LAZY_LOAD_THRESHOLD: int = 1
+
+    # Static export of the public API (scripts/export_snapshot.py, POST /snapshot/):
+    # JSON files with .gz/.br siblings and a manifest, for a static server or CDN
+    SNAPSHOT_DIR: str = "./snapshot"
+
+    # Production server (python -m app.serve); SERVER_WORKERS=0 means one per available core.
+    # Workers share nothing in memory: see RESPONSE_CACHE_SYNC_SECONDS for the response cache
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 2048  # pending connections the kernel queues per listening socket
+    SERVER_KEEPALIVE_SECONDS: int = 75  # longer than the proxy/load balancer idle timeout
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30  # in-flight requests get this long on SIGTERM
+    SERVER_MAX_REQUESTS: Optional[int] = None  # recycle a worker after this many requests
+    SERVER_ACCESS_LOG: bool = False  # the reverse proxy usually logs requests already
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"  # proxies trusted for X-Forwarded-For
+
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
 
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
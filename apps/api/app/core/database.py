@@ -1,19 +1,324 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import itertools
+import threading
+import time
+from collections import Counter
+from typing import Union
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.core.timing import request_timing
 
-# Handle both SQLite and PostgreSQL connection args
-connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
+def connect_args_for(url: str) -> dict:
+    # Handle both SQLite and PostgreSQL connection args
+    if url.startswith("sqlite"):
+        return {"check_same_thread": False}
+    return {}
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+connect_args = connect_args_for(settings.DATABASE_URL)
+
+class _TimedPoolMixin:
+    """Records how long callers wait for a pooled connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url: str, pool_class=TimedQueuePool) -> dict:
+    """Engine keyword arguments for the pool configured in Settings"""
+    url = make_url(url)
+    # In-memory SQLite lives in a single connection; leave its pool alone
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+# The sync engine is always available (scripts, create_all, sync mode)
+engine = create_engine(settings.DATABASE_URL, connect_args=connect_args, **pool_options(settings.DATABASE_URL))
+# Rows loaded by RETURNING stay usable after commit instead of being re-SELECTed
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+# asyncio driver used for each backend when DATABASE_ASYNC is on
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+def async_database_url(url: str) -> str:
+    """Swap the sync DBAPI driver in a database URL for its asyncio counterpart"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for '{backend}' databases")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.DATABASE_ASYNC:
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        **pool_options(settings.DATABASE_URL, TimedAsyncQueuePool),
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Read replicas, in the flavour the routes use
+if settings.DATABASE_ASYNC:
+    replica_engines = [
+        create_async_engine(async_database_url(url), **pool_options(url, TimedAsyncQueuePool))
+        for url in settings.replica_urls
+    ]
+else:
+    replica_engines = [
+        create_engine(url, connect_args=connect_args_for(url), **pool_options(url))
+        for url in settings.replica_urls
+    ]
+
+def _sync_engine(db_engine):
+    return getattr(db_engine, "sync_engine", db_engine)
+
+def _checked_out(pool) -> int:
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+class ReplicaRouter:
+    """Picks the engine behind each ``get_read_db`` session.
+
+    Sessions go to the replicas in turn ("round_robin") or to the one with
+    the fewest checked-out connections ("least_connections"), and to the
+    primary when there are none. A replica that fails to connect, or drops a
+    connection, is skipped for ``retry_seconds`` and the read that hit it is
+    retried once on the primary (see ``run_db``); with every replica down,
+    reads fall back to the primary. For ``sticky_seconds`` after a commit in
+    this process reads go to the primary as well, so a replica that hasn't
+    replayed the write yet can't refill the cache with the old rows.
+    """
+
+    def __init__(self, primary, replicas, policy: str = "round_robin",
+                 retry_seconds: float = 30.0, sticky_seconds: float = 5.0):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.policy = policy
+        self.retry_seconds = retry_seconds
+        self.sticky_seconds = sticky_seconds
+        self._turn = itertools.count()
+        self._down_until = {}  # sync engine -> monotonic time it is tried again
+        self._last_write = float("-inf")
+        self._stats_lock = threading.Lock()
+        self.sessions = Counter()  # "primary" / "replica-N" -> read sessions routed there
+        self.failures = Counter()
+        self.fallbacks = 0  # reads retried on the primary after their replica failed
+        self._names = {_sync_engine(replica): f"replica-{index}" for index, replica in enumerate(self.replicas)}
+        for replica in self.replicas:
+            event.listen(_sync_engine(replica), "handle_error", self._on_error)
+        if self.replicas:
+            event.listen(Session, "after_commit", self._on_commit)
+
+    def _on_error(self, context):
+        # No connection yet: the connect itself failed
+        if context.connection is None or context.is_disconnect:
+            with self._stats_lock:
+                self._down_until[context.engine] = time.monotonic() + self.retry_seconds
+                self.failures[self._names[context.engine]] += 1
+
+    def _on_commit(self, session):
+        self.mark_write()
+
+    def mark_write(self):
+        """Start the sticky window, e.g. for a write another worker reported"""
+        self._last_write = time.monotonic()
+
+    def _route(self, db_engine, name: str):
+        with self._stats_lock:
+            self.sessions[name] += 1
+        return db_engine
+
+    def choose(self):
+        now = time.monotonic()
+        if not self.replicas or now - self._last_write < self.sticky_seconds:
+            return self._route(self.primary, "primary")
+        healthy = [replica for replica in self.replicas if self._down_until.get(_sync_engine(replica), 0) <= now]
+        if not healthy:
+            return self._route(self.primary, "primary")
+        # Rotate the starting point so least_connections also spreads ties
+        start = next(self._turn) % len(healthy)
+        candidates = healthy[start:] + healthy[:start]
+        replica = candidates[0]
+        if self.policy == "least_connections":
+            replica = min(candidates, key=lambda candidate: _checked_out(_sync_engine(candidate).pool))
+        return self._route(replica, self._names[_sync_engine(replica)])
+
+    def fallback(self, session: Session) -> bool:
+        """Rebind a read session to the primary if its replica was just marked down"""
+        now = time.monotonic()
+        with self._stats_lock:
+            if session.bind not in self._names or self._down_until.get(session.bind, 0) <= now:
+                return False
+            self.fallbacks += 1
+        session.rollback()
+        session.bind = _sync_engine(self.primary)
+        return True
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._stats_lock:
+            return {
+                "policy": self.policy,
+                "sticky": now - self._last_write < self.sticky_seconds,
+                "sessions": dict(self.sessions),
+                "fallbacks": self.fallbacks,
+                "replicas": [
+                    {
+                        "name": name,
+                        "url": db_engine.url.render_as_string(hide_password=True),
+                        "healthy": self._down_until.get(db_engine, 0) <= now,
+                        "failures": self.failures[name],
+                    }
+                    for db_engine, name in self._names.items()
+                ],
+            }
+
+read_router = ReplicaRouter(
+    async_engine if settings.DATABASE_ASYNC else engine,
+    replica_engines,
+    policy=settings.DATABASE_REPLICA_POLICY,
+    retry_seconds=settings.DATABASE_REPLICA_RETRY_SECONDS,
+    sticky_seconds=settings.DATABASE_REPLICA_STICKY_SECONDS,
+)
+
+# Either session flavour, depending on DATABASE_ASYNC
+AnySession = Union[Session, AsyncSession]
+
+# get_db is the primary, for writes (and reads that must see them);
+# get_read_db, for GET routes, is a replica when any is configured
+if settings.DATABASE_ASYNC:
+    async def get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    async def get_read_db():
+        async with AsyncSessionLocal(bind=read_router.choose()) as db:
+            yield db
+else:
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def get_read_db():
+        db = SessionLocal(bind=read_router.choose())
+        try:
+            yield db
+        finally:
+            db.close()
+
+async def run_db(db: AnySession, fn, *args, **kwargs):
+    """Run synchronous ORM code ``fn(session, *args)`` without blocking the event loop.
+
+    On an AsyncSession the code runs on the asyncio driver via ``run_sync``
+    (no threads involved); a plain Session is driven from the threadpool.
+    """
+    timing = request_timing.get()
+    if timing is None:
+        return await _run_db(db, fn, *args, **kwargs)
+    start = time.perf_counter()
     try:
-        yield db
+        return await _run_db(db, fn, *args, **kwargs)
     finally:
-        db.close()
+        timing.db += time.perf_counter() - start
+
+async def _run_db(db: AnySession, fn, *args, **kwargs):
+    try:
+        return await _run_db_once(db, fn, *args, **kwargs)
+    except exc.DBAPIError:
+        # A read session whose replica went away: the primary has the same rows
+        if not await _run_db_once(db, read_router.fallback):
+            raise
+    if isinstance(db, AsyncSession):
+        db.bind = read_router.primary
+    return await _run_db_once(db, fn, *args, **kwargs)
+
+async def _run_db_once(db: AnySession, fn, *args, **kwargs):
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+async def dispose_engines():
+    """Close every pooled connection (application shutdown)"""
+    engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+    for replica in replica_engines:
+        if settings.DATABASE_ASYNC:
+            await replica.dispose()
+        else:
+            replica.dispose()
+
+def _pool_status(pool) -> dict:
+    status = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, _TimedPoolMixin):
+        with pool._stats_lock:
+            status.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                wait_seconds_total=round(pool.wait_seconds_total, 6),
+                wait_seconds_max=round(pool.wait_seconds_max, 6),
+                wait_seconds_avg=round(pool.wait_seconds_total / pool.checkouts, 6) if pool.checkouts else 0.0,
+            )
+    return status
+
+def all_engines() -> dict:
+    """Every configured engine by name, as sync ``Engine`` objects (pools, event listeners)"""
+    engines = {"sync": engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    for index, replica in enumerate(replica_engines):
+        engines[f"replica-{index}"] = _sync_engine(replica)
+    return engines
+
+def pool_status() -> dict:
+    """Snapshot of every engine's connection pool"""
+    return {name: _pool_status(db_engine.pool) for name, db_engine in all_engines().items()}
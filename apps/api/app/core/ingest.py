@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import uuid
+from contextlib import suppress
+from typing import Awaitable, Callable, Dict, List, Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, SessionLocal, run_db
+from app.models.contact import Contact
+from app.models.mixins import utcnow
+
+logger = logging.getLogger(__name__)
+
+BatchWriter = Callable[[List[Dict]], Awaitable[None]]
+
+class QueueFull(Exception):
+    """The ingestion queue is at capacity; the client should retry later"""
+
+class IngestQueue:
+    """Bounded in-process queue drained by a background task in batches.
+
+    ``submit`` only appends to an ``asyncio.Queue``; the writer task waits for
+    the first row, then keeps collecting until ``batch_size`` rows are queued
+    or ``flush_interval`` seconds have passed, and hands the batch to
+    ``writer`` in one call. Swap ``writer`` to send rows somewhere other than
+    the database (a broker, another service).
+
+    The rows were already acknowledged, so a failed batch is retried
+    ``retries`` times, ``retry_delay`` seconds apart and doubling, then
+    written one row at a time: a single bad row only loses itself. Rows that
+    still fail are logged in full.
+    """
+
+    def __init__(self, writer: BatchWriter, max_size: int, batch_size: int, flush_interval: float,
+                 retries: int = 2, retry_delay: float = 0.5):
+        self.writer = writer
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[Dict] = []  # rows taken off the queue, not yet handed to writer
+        self._inflight: Optional[asyncio.Future] = None
+        self.accepted = 0
+        self.rejected = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.retried = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        # Created here so the queue belongs to the server's event loop
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop accepting rows and flush everything still queued"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._inflight is not None:
+            await self._inflight
+        rows, self._batch = self._batch + self._take(self._queue.qsize()), []
+        for start in range(0, len(rows), self.batch_size):
+            await self._flush(rows[start:start + self.batch_size])
+
+    def submit(self, row: Dict) -> str:
+        """Queue ``row`` for writing and return its submission id"""
+        if not self.running:
+            raise RuntimeError("Ingest queue is not running")
+        submission_id = uuid.uuid4().hex
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFull()
+        self.accepted += 1
+        return submission_id
+
+    def _take(self, limit: int) -> List[Dict]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                self._batch.extend(self._take(self.batch_size - len(self._batch)))
+                remaining = deadline - loop.time()
+                if len(self._batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._batch = self._batch, []
+            # Shielded so that stop() never cancels a write halfway through
+            self._inflight = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._inflight)
+
+    async def _flush(self, batch: List[Dict]):
+        if not batch:
+            return
+        for attempt in range(max(self.retries, 0) + 1):
+            if attempt:
+                self.retried += 1
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                await self.writer(batch)
+            except Exception as exc:
+                error = exc
+                logger.warning("Failed to write %d queued rows (attempt %d)", len(batch), attempt + 1, exc_info=True)
+                continue
+            self.written += len(batch)
+            self.batches += 1
+            return
+
+        # Keep whatever can be written: usually the batch fails on one bad row
+        for row in batch:
+            if len(batch) > 1:
+                try:
+                    await self.writer([row])
+                except Exception as exc:
+                    error = exc
+                else:
+                    self.written += 1
+                    self.batches += 1
+                    continue
+            self.failed += 1
+            logger.error("Dropped queued row %r", row, exc_info=error)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "written": self.written,
+            "failed": self.failed,
+            "retried": self.retried,
+            "batches": self.batches,
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+        }
+
+def _insert_contacts(db: Session, rows: List[Dict]):
+    # executemany: one statement and one commit (one fsync) for the whole batch
+    db.execute(insert(Contact), rows)
+    db.commit()
+
+async def write_contacts(rows: List[Dict]):
+    """Default ``BatchWriter`` for contact submissions"""
+    if settings.DATABASE_ASYNC:
+        async with AsyncSessionLocal() as db:
+            await run_db(db, _insert_contacts, rows)
+    else:
+        db = SessionLocal()
+        try:
+            await run_db(db, _insert_contacts, rows)
+        finally:
+            db.close()
+
+def contact_row(contact) -> Dict:
+    """Column values for a validated ``ContactCreate``, stamped at submission time"""
+    now = utcnow()
+    return {**contact.model_dump(), "status": "new", "created_at": now, "updated_at": now}
+
+contact_queue = IngestQueue(
+    write_contacts,
+    max_size=settings.CONTACT_QUEUE_MAX_SIZE,
+    batch_size=settings.CONTACT_QUEUE_BATCH_SIZE,
+    flush_interval=settings.CONTACT_QUEUE_FLUSH_SECONDS,
+    retries=settings.CONTACT_QUEUE_RETRIES,
+    retry_delay=settings.CONTACT_QUEUE_RETRY_SECONDS,
+)
@@ -0,0 +1,118 @@
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class LazyLoadError(RuntimeError):
+    """A relationship was lazy-loaded more times than the guard's threshold allows"""
+
+class LazyLoads(Counter):
+    """relationship ("Skill.category") -> lazy loads within one tracked scope"""
+
+    def __init__(self, label: str):
+        super().__init__()
+        self.label = label
+
+# (guard, loads) for the scope being tracked; None outside one
+_tracking: ContextVar = ContextVar("lazy_load_tracking", default=None)
+
+def _count_lazy_load(orm_execute_state):
+    tracking = _tracking.get()
+    # lazy_loaded_from is only set for lazy loads, not joinedload/selectinload,
+    # and the event only fires when the load emits SQL (identity map misses)
+    if tracking is None or orm_execute_state.lazy_loaded_from is None:
+        return
+    guard, loads = tracking
+    relationship = str(orm_execute_state.loader_strategy_path[-1])
+    loads[relationship] += 1
+    if guard.action == "raise" and loads[relationship] > guard.threshold:
+        raise LazyLoadError(
+            f"{loads.label}: {relationship} lazy-loaded {loads[relationship]} times "
+            f"(threshold {guard.threshold}); eager-load it with selectinload()/joinedload()"
+        )
+
+class LazyLoadGuard:
+    """N+1 detector: counts SQL-emitting lazy loads per relationship.
+
+    Inside ``track()`` (every request, through ``LazyLoadMiddleware``) each
+    lazy load is counted against the relationship it loads, so a loop that
+    touches ``skill.category`` for every row shows up as one relationship
+    loaded N times. Past ``threshold`` loads of the same relationship,
+    ``action`` "warn" logs the scope once it ends, "raise" fails the load
+    with ``LazyLoadError`` (failing the request and any test behind it) and
+    "record" only keeps the worst counts in ``violations``.
+    """
+
+    def __init__(self, threshold: int, action: str = "warn"):
+        self.threshold = threshold
+        self.action = action
+        self.tracked = 0
+        self.violations: Dict[str, Dict[str, int]] = {}  # label -> worst loads per relationship
+
+    def install(self):
+        if not event.contains(Session, "do_orm_execute", _count_lazy_load):
+            event.listen(Session, "do_orm_execute", _count_lazy_load)
+
+    @contextmanager
+    def track(self, label: str = "block"):
+        """Count lazy loads inside the block; yields its ``LazyLoads``"""
+        self.install()
+        loads = LazyLoads(label)
+        token = _tracking.set((self, loads))
+        try:
+            yield loads
+        finally:
+            _tracking.reset(token)
+            self.tracked += 1
+            self._record(loads)
+
+    def _record(self, loads: LazyLoads):
+        label = loads.label
+        over = {relationship: count for relationship, count in loads.items() if count > self.threshold}
+        if not over:
+            return
+        worst = self.violations.setdefault(label, {})
+        for relationship, count in over.items():
+            worst[relationship] = max(worst.get(relationship, 0), count)
+        if self.action == "warn":
+            details = ", ".join(f"{relationship} x{count}" for relationship, count in over.items())
+            logger.warning("Possible N+1 in %s: %s lazy-loaded past the threshold of %d", label, details, self.threshold)
+
+    def stats(self) -> dict:
+        return {
+            "mode": settings.LAZY_LOAD_GUARD,
+            "threshold": self.threshold,
+            "tracked": self.tracked,
+            "violations": self.violations,
+        }
+
+class LazyLoadMiddleware:
+    """ASGI middleware tracking each HTTP request with a ``LazyLoadGuard``"""
+
+    def __init__(self, app, guard: LazyLoadGuard):
+        self.app = app
+        self.guard = guard
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        with self.guard.track(f"{scope['method']} {scope['path']}") as loads:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # File violations under the route template rather than every
+                # concrete path; it is only known once routing has run
+                route = scope.get("route")
+                if route is not None:
+                    loads.label = f"{scope['method']} {route.path}"
+
+lazy_load_guard = LazyLoadGuard(
+    threshold=settings.LAZY_LOAD_THRESHOLD,
+    action="raise" if settings.LAZY_LOAD_GUARD == "raise" else "warn",
+)
@@ -0,0 +1,143 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from fastapi import HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, or_, tuple_
+from app.core.config import settings
+
+class PageParams(NamedTuple):
+    cursor: Optional[str]
+    limit: int
+    fields: Optional[str]
+
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: Optional[str]
+    # Set when ``items`` are projected, already serialized dicts rather than ORM objects
+    fields: Optional[List[str]] = None
+
+    @property
+    def headers(self):
+        return {"X-Next-Cursor": self.next_cursor} if self.next_cursor else {}
+
+
+def page_params(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return"),
+) -> PageParams:
+    """Query parameters shared by every paginated list endpoint"""
+    return PageParams(cursor, limit, fields)
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+def _decode_value(value, column):
+    if isinstance(value, dict) and isinstance(value.get("dt"), str):
+        value = datetime.fromisoformat(value["dt"])
+    if value is None:
+        return value
+    try:
+        expected = (column.type.python_type,)
+    except NotImplementedError:
+        # Untyped (e.g. textual) columns: any scalar
+        expected = (bool, int, float, str, datetime)
+    if expected == (float,):
+        expected = (int, float)
+    # bool is an int, but never a valid cursor for an integer column
+    if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+        raise ValueError(f"cursor value {value!r} doesn't match {column}")
+    return value
+
+def encode_cursor(values) -> str:
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    """Cursor values for ``columns``; 400 unless each one fits its column's type"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("wrong number of values")
+        return [_decode_value(value, column) for value, column in zip(values, columns)]
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after(keys, values):
+    """WHERE clause selecting rows strictly after ``values`` in ``keys`` order"""
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        # Row-value comparison lets the database seek straight into the index
+        row = tuple_(*[column for column, _ in keys])
+        return row < tuple(values) if directions.pop() else row > tuple(values)
+
+    (column, descending), value = keys[0], values[0]
+    beyond = column < value if descending else column > value
+    if len(keys) == 1:
+        return beyond
+    return or_(beyond, and_(column == value, _after(keys[1:], values[1:])))
+
+
+def _projection(model, schema, fields: str) -> List[str]:
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    allowed = [name for name in model.__table__.columns.keys() if schema is None or name in schema.model_fields]
+    unknown = [name for name in names if name not in allowed]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}. Allowed: {', '.join(allowed)}",
+        )
+    return list(dict.fromkeys(names))
+
+
+def keyset_paginate(query, model, keys: Sequence[Tuple[object, bool]], params: PageParams, schema=None) -> Page:
+    """Fetch one page of ``query`` ordered by ``keys``.
+
+    ``keys`` is a list of ``(column, descending)`` pairs that must end with a
+    unique column (the primary key), so the cursor identifies a single row.
+    Only ``limit + 1`` rows are read; with ``fields`` only the requested
+    columns (plus the key columns) are selected, and serialized by the
+    route's ``schema`` as they would be in the full response.
+    """
+    if params.cursor:
+        query = query.filter(_after(keys, decode_cursor(params.cursor, [column for column, _ in keys])))
+    query = query.order_by(*[column.desc() if descending else column.asc() for column, descending in keys])
+
+    fields = None
+    if params.fields:
+        fields = _projection(model, schema, params.fields)
+        selected = list(dict.fromkeys([*fields, *(column.key for column, _ in keys)]))
+        query = query.with_entities(*[getattr(model, name) for name in selected])
+
+    rows = query.limit(params.limit + 1).all()
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column, _ in keys])
+
+    if fields and schema is not None:
+        # model_construct skips validation of the columns that weren't selected
+        include = set(fields)
+        rows = [schema.model_construct(**row._asdict()).model_dump(mode="json", include=include) for row in rows]
+    elif fields:
+        rows = [{name: getattr(row, name) for name in fields} for row in rows]
+    return Page(rows, next_cursor, fields)
+
+
+def page_response(page: Page, response: Response):
+    """Return a Page from an uncached handler, with its cursor header"""
+    if page.fields:
+        # Projected rows don't satisfy the full response_model
+        return JSONResponse(content=jsonable_encoder(page.items), headers=page.headers)
+    response.headers.update(page.headers)
+    return page.items
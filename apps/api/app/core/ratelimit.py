@@ -0,0 +1,209 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, Tuple
+from fastapi import HTTPException, Request
+from app.core.config import settings
+
+class MemoryBackend:
+    """Token buckets and a dedupe window kept in process memory.
+
+    Both maps are LRU-bounded to ``max_keys`` so a flood of distinct IPs or
+    emails cannot grow memory without limit; an evicted bucket simply starts
+    full again, which errs on the side of letting traffic through.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, updated_at)
+        self._seen = OrderedDict()  # digest -> expires_at
+        self._lock = threading.Lock()
+
+    def _bound(self, entries: OrderedDict):
+        while len(entries) > self.max_keys:
+            entries.popitem(last=False)
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Spend one token; return 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            self._bound(self._buckets)
+        return wait
+
+    async def refund(self, key: str, burst: int):
+        """Give back the token of a request that failed on the server's side"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets[key] = (min(burst, bucket[0] + 1), bucket[1])
+
+    async def seen(self, digest: str, window: int) -> bool:
+        """Record ``digest``; True if it was already recorded within ``window`` seconds"""
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._seen.get(digest)
+            if expires_at is not None and expires_at > now:
+                return True
+            self._seen[digest] = now + window
+            self._seen.move_to_end(digest)
+            self._bound(self._seen)
+        return False
+
+    async def forget(self, digest: str):
+        with self._lock:
+            self._seen.pop(digest, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "buckets": len(self._buckets), "fingerprints": len(self._seen), "max_keys": self.max_keys}
+
+# KEYS[1] = bucket; ARGV = rate, burst, now. Returns the wait in milliseconds.
+_TAKE_SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local tokens = math.min(burst, (tonumber(bucket[1]) or burst) + (now - (tonumber(bucket[2]) or now)) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return math.ceil(wait * 1000)
+"""
+
+# KEYS[1] = bucket; ARGV = burst. Adds back one token, if the bucket still exists.
+_REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then redis.call('HSET', KEYS[1], 'tokens', math.min(tonumber(ARGV[1]), tokens + 1)) end
+return 0
+"""
+
+class RedisBackend:
+    """Same contract as ``MemoryBackend``, shared by every worker through Redis (or Valkey, KeyDB...)"""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError("RATE_LIMIT_REDIS_URL is set but the 'redis' package is not installed") from exc
+        self.url = url
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+        self._refund = self._client.register_script(_REFUND_SCRIPT)
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        return await self._take(keys=[self.prefix + key], args=[rate, burst, time.time()]) / 1000
+
+    async def refund(self, key: str, burst: int):
+        await self._refund(keys=[self.prefix + key], args=[burst])
+
+    async def seen(self, digest: str, window: int) -> bool:
+        # SET NX only succeeds for the first submission in the window
+        return not await self._client.set(self.prefix + "seen:" + digest, 1, nx=True, ex=window)
+
+    async def forget(self, digest: str):
+        await self._client.delete(self.prefix + "seen:" + digest)
+
+    def stats(self) -> dict:
+        return {"backend": "redis"}
+
+class ContactGuard:
+    """Rejects contact submissions before they reach the database.
+
+    Checks, in order: a token bucket per client IP, a token bucket per sender
+    email (either is skipped when its rate is 0), and a fingerprint of the submission's content so an identical
+    message re-posted within the dedupe window is dropped. Use ``admit`` around
+    storing the submission: if that fails (queue full, database error), the
+    tokens are refunded and the fingerprint forgotten, so the client's retry
+    isn't rejected for the server's failure.
+    """
+
+    def __init__(self, backend, ip_limit: Tuple[int, float], email_limit: Tuple[int, float], dedupe_window: int):
+        self.backend = backend
+        self.ip_limit = ip_limit  # (burst, tokens per second)
+        self.email_limit = email_limit
+        self.dedupe_window = dedupe_window
+        self.allowed = 0
+        self.limited = 0
+        self.duplicates = 0
+        self.refunded = 0
+
+    @staticmethod
+    def fingerprint(contact) -> str:
+        normalized = "\x1f".join(" ".join(str(value).lower().split()) for value in (contact.email, contact.name, contact.message))
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    async def _limit(self, key: str, limit: Tuple[int, float]):
+        burst, rate = limit
+        # A bucket that never refills would divide by zero: a rate of 0 turns the limit off
+        if rate <= 0:
+            return
+        wait = await self.backend.take(key, rate, burst)
+        if wait > 0:
+            self.limited += 1
+            raise HTTPException(
+                status_code=429,
+                detail="Too many submissions, try again later",
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+
+    def _buckets(self, request: Request, contact):
+        # request.client is the peer address; run uvicorn with --proxy-headers
+        # (and --forwarded-allow-ips) behind a reverse proxy so it is the real client
+        client = request.client.host if request.client else "unknown"
+        return [(f"ip:{client}", self.ip_limit), (f"email:{contact.email.lower()}", self.email_limit)]
+
+    async def check(self, request: Request, contact):
+        for key, limit in self._buckets(request, contact):
+            await self._limit(key, limit)
+        if self.dedupe_window > 0 and await self.backend.seen(self.fingerprint(contact), self.dedupe_window):
+            self.duplicates += 1
+            raise HTTPException(status_code=409, detail="Duplicate submission")
+        self.allowed += 1
+
+    @asynccontextmanager
+    async def admit(self, request: Request, contact):
+        """``check``, undone if the block storing the submission raises"""
+        await self.check(request, contact)
+        try:
+            yield
+        except BaseException:
+            for key, (burst, rate) in self._buckets(request, contact):
+                if rate > 0:
+                    await self.backend.refund(key, burst)
+            if self.dedupe_window > 0:
+                await self.backend.forget(self.fingerprint(contact))
+            self.allowed -= 1
+            self.refunded += 1
+            raise
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.CONTACT_RATE_LIMIT_ENABLED,
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "duplicates": self.duplicates,
+            "refunded": self.refunded,
+            **self.backend.stats(),
+        }
+
+def _backend(url: Optional[str]):
+    return RedisBackend(url) if url else MemoryBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+contact_guard = ContactGuard(
+    _backend(settings.RATE_LIMIT_REDIS_URL),
+    ip_limit=(settings.CONTACT_IP_BURST, settings.CONTACT_IP_PER_MINUTE / 60),
+    email_limit=(settings.CONTACT_EMAIL_BURST, settings.CONTACT_EMAIL_PER_MINUTE / 60),
+    dedupe_window=settings.CONTACT_DEDUPE_WINDOW_SECONDS,
+)
@@ -0,0 +1,244 @@
+"""
+Static snapshot of the public API, for a static server or CDN in front of it.
+
+Every public collection and item is rendered to the JSON the matching GET
+route returns, at a path mirroring its URL (``/projects/`` ->
+``projects/index.json``, ``/projects/3`` -> ``projects/3.json``), each next
+to ``.gz`` and ``.br`` precompressed siblings. ``manifest.json`` lists every
+file with its SHA-256 and sizes, and per collection a fingerprint of its
+tables (row count and newest ``updated_at``).
+
+Exports are incremental: a collection whose fingerprint matches the manifest
+is not rendered at all, and a rendered file whose hash is unchanged is not
+rewritten, so its mtime (and a CDN's cached copy) stays valid. Files are
+replaced atomically, and the manifest last.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+import brotli
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+from app.core.config import settings
+from app.core.tags import tag_counts
+from app.models.about import About, Stat
+from app.models.experience import Experience
+from app.models.project import Project
+from app.models.skill import Skill, SkillCategory
+from app.models.social_link import SocialLink
+from app.schemas.about import About as AboutSchema, Stat as StatSchema
+from app.schemas.experience import Experience as ExperienceSchema
+from app.schemas.portfolio import Portfolio
+from app.schemas.project import Project as ProjectSchema
+from app.schemas.skill import Skill as SkillSchema, SkillCategory as SkillCategorySchema
+from app.schemas.social_link import SocialLink as SocialLinkSchema
+from app.schemas.tag import TagCount
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+# Precompressed siblings: suffix -> compressor (deterministic output, so unchanged bodies compress identically)
+ENCODINGS: Dict[str, Callable[[bytes], bytes]] = {
+    ".gz": lambda body: gzip.compress(body, compresslevel=9, mtime=0),
+    ".br": lambda body: brotli.compress(body, quality=11),
+}
+
+# path -> (schema, value) for every file of a collection
+Documents = Dict[str, Tuple[Any, Any]]
+
+@dataclass(frozen=True)
+class Collection:
+    name: str
+    models: Tuple[type, ...]  # tables whose rows it is built from
+    render: Callable[[Session], Documents]
+
+def _ordered(db: Session, model, *options):
+    return db.query(model).options(*options).order_by(model.order_index, model.id).all()
+
+def _categories(db: Session):
+    return _ordered(db, SkillCategory, selectinload(SkillCategory.skills))
+
+def _list_and_items(path: str, schema, rows) -> Documents:
+    documents = {f"{path}/index.json": (List[schema], rows)}
+    documents.update({f"{path}/{row.id}.json": (schema, row) for row in rows})
+    return documents
+
+def _render_projects(db: Session) -> Documents:
+    projects = _ordered(db, Project)
+    documents = _list_and_items("projects", ProjectSchema, projects)
+    documents["projects/featured.json"] = (List[ProjectSchema], [project for project in projects if project.featured])
+    return documents
+
+def _render_skills(db: Session) -> Documents:
+    categories = _categories(db)
+    skills = db.query(Skill).order_by(Skill.category_id, Skill.order_index, Skill.id).all()
+    documents = _list_and_items("skills", SkillSchema, skills)
+    documents["skills/categories.json"] = (List[SkillCategorySchema], categories)
+    documents.update({f"skills/categories/{category.id}.json": (SkillCategorySchema, category) for category in categories})
+    return documents
+
+def _render_about(db: Session) -> Documents:
+    sections = _ordered(db, About)
+    documents = {"about/content.json": (List[AboutSchema], sections)}
+    documents.update({f"about/content/{section.id}.json": (AboutSchema, section) for section in sections})
+    return documents
+
+def _render_stats(db: Session) -> Documents:
+    stats = _ordered(db, Stat)
+    documents = {"about/stats.json": (List[StatSchema], stats)}
+    documents.update({f"about/stats/{stat.id}.json": (StatSchema, stat) for stat in stats})
+    return documents
+
+def _render_tags(db: Session) -> Documents:
+    return {
+        "tags/index.json": (List[TagCount], tag_counts(db, [Project, Experience])),
+        "tags/project.json": (List[TagCount], tag_counts(db, [Project])),
+        "tags/experience.json": (List[TagCount], tag_counts(db, [Experience])),
+    }
+
+def _render_portfolio(db: Session) -> Documents:
+    portfolio = Portfolio(
+        projects=_ordered(db, Project),
+        experiences=_ordered(db, Experience),
+        skill_categories=_categories(db),
+        about=_ordered(db, About),
+        stats=_ordered(db, Stat),
+        social_links=_ordered(db, SocialLink),
+    )
+    return {"portfolio/index.json": (Portfolio, portfolio)}
+
+# Contacts are private and /search takes free text, so neither is exported
+COLLECTIONS = [
+    Collection("projects", (Project,), _render_projects),
+    Collection("experiences", (Experience,), lambda db: _list_and_items("experiences", ExperienceSchema, _ordered(db, Experience))),
+    Collection("skills", (SkillCategory, Skill), _render_skills),
+    Collection("about", (About,), _render_about),
+    Collection("stats", (Stat,), _render_stats),
+    Collection("social_links", (SocialLink,), lambda db: _list_and_items("social-links", SocialLinkSchema, _ordered(db, SocialLink))),
+    Collection("tags", (Project, Experience), _render_tags),
+    Collection("portfolio", (Project, Experience, SkillCategory, Skill, About, Stat, SocialLink), _render_portfolio),
+]
+
+def table_fingerprint(db: Session, model) -> List[Any]:
+    """[row count, newest updated_at]: moves on every insert, update and delete"""
+    count, newest = db.execute(select(func.count(), func.max(model.updated_at)).select_from(model)).one()
+    return [count, newest.isoformat() if isinstance(newest, datetime) else newest]
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+def render_json(schema, value) -> bytes:
+    """The body the API sends for ``value`` under ``response_model=schema``"""
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(schema)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+def _remove(out: Path, path: str):
+    for suffix in ("", *ENCODINGS):
+        (out / f"{path}{suffix}").unlink(missing_ok=True)
+
+def _is_current(out: Path, path: str, entry) -> bool:
+    """The manifest lists ``path`` and the file and its siblings are on disk"""
+    return entry is not None and all((out / f"{path}{suffix}").exists() for suffix in ("", *ENCODINGS))
+
+def load_manifest(out: Path) -> dict:
+    try:
+        manifest = json.loads((out / MANIFEST).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+class SnapshotExporter:
+    """Writes ``COLLECTIONS`` under ``out``; one export at a time per process"""
+
+    def __init__(self, out):
+        self.out = Path(out)
+        self._lock = threading.Lock()
+
+    def export(self, db: Session, force: bool = False) -> dict:
+        """Bring the snapshot up to date; ``force`` re-renders every collection"""
+        with self._lock:
+            return self._export(db, force)
+
+    def _export(self, db: Session, force: bool) -> dict:
+        # One snapshot of the database for fingerprints and rows alike.
+        # SQLite serializes writers already, Postgres needs REPEATABLE READ.
+        if db.get_bind().dialect.name != "sqlite":
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        previous = load_manifest(self.out)
+        old_collections, old_files = previous.get("collections", {}), previous.get("files", {})
+        collections, files = {}, {}
+        summary = {"rendered": [], "skipped": [], "written": 0, "unchanged": 0, "removed": 0}
+        fingerprints = {model: table_fingerprint(db, model) for collection in COLLECTIONS for model in collection.models}
+
+        for collection in COLLECTIONS:
+            fingerprint = {model.__tablename__: fingerprints[model] for model in collection.models}
+            old = old_collections.get(collection.name)
+            if (not force and old is not None and old["fingerprint"] == fingerprint
+                    and all(_is_current(self.out, path, old_files.get(path)) for path in old["files"])):
+                collections[collection.name] = old
+                files.update({path: old_files[path] for path in old["files"]})
+                summary["skipped"].append(collection.name)
+                continue
+
+            paths = []
+            for path, (schema, value) in collection.render(db).items():
+                body = render_json(schema, value)
+                digest = hashlib.sha256(body).hexdigest()
+                entry = old_files.get(path)
+                if _is_current(self.out, path, entry) and entry["sha256"] == digest:
+                    summary["unchanged"] += 1
+                else:
+                    entry = {"sha256": digest, "bytes": len(body)}
+                    _write_atomic(self.out / path, body)
+                    for suffix, compress in ENCODINGS.items():
+                        encoded = compress(body)
+                        _write_atomic(self.out / f"{path}{suffix}", encoded)
+                        entry[f"{suffix[1:]}_bytes"] = len(encoded)
+                    summary["written"] += 1
+                files[path] = entry
+                paths.append(path)
+            collections[collection.name] = {"fingerprint": fingerprint, "files": sorted(paths)}
+            summary["rendered"].append(collection.name)
+
+            # Items deleted since the last export
+            for path in old["files"] if old is not None else []:
+                if path not in files:
+                    _remove(self.out, path)
+                    summary["removed"] += 1
+
+        files = dict(sorted(files.items()))
+        summary["files"] = len(files)
+        # generated_at only moves when something did
+        if previous.get("collections") != collections or old_files != files:
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "collections": collections,
+                "files": files,
+            }
+            _write_atomic(self.out / MANIFEST, json.dumps(manifest, indent=2).encode())
+        return summary
+
+snapshot_exporter = SnapshotExporter(settings.SNAPSHOT_DIR)
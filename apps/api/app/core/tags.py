@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models.experience import Experience
+from app.models.project import Project
+from app.models.tag import Tag, experience_tags, project_tags
+from app.schemas.tag import TagCount
+
+# model -> (association table, its column referencing the model); also the
+# ``children`` format bulk_delete expects
+TAGGED = {
+    Project: (project_tags, project_tags.c.project_id),
+    Experience: (experience_tags, experience_tags.c.experience_id),
+}
+
+_UPSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+def _clean(tags: Optional[Iterable]) -> Dict[str, str]:
+    """slug -> display name for a tags list, dropping blanks and case-insensitive duplicates"""
+    names = {}
+    for tag in tags or []:
+        name = str(tag).strip()[:100]
+        if name:
+            names.setdefault(name.lower(), name)
+    return names
+
+def _tag_ids(db: Session, names: Dict[str, str]) -> Dict[str, int]:
+    """Ids for every slug in ``names``, creating the tags that don't exist yet"""
+    if not names:
+        return {}
+    ids = dict(db.execute(select(Tag.slug, Tag.id).where(Tag.slug.in_(list(names)))).all())
+    missing = [{"slug": slug, "name": name} for slug, name in names.items() if slug not in ids]
+    if missing:
+        # ON CONFLICT DO NOTHING: a concurrent writer may create the same tag
+        db.execute(_UPSERTS[db.get_bind().dialect.name](Tag).on_conflict_do_nothing(index_elements=["slug"]), missing)
+        ids.update(db.execute(select(Tag.slug, Tag.id).where(Tag.slug.in_([row["slug"] for row in missing]))).all())
+    return ids
+
+def sync_tags(db: Session, model, tags_by_id: Dict[int, Optional[list]]):
+    """Rewrite the tag links of the given ``model`` rows from their JSON ``tags``.
+
+    Call inside the write's transaction, before commit.
+    """
+    if not tags_by_id:
+        return
+    table, column = TAGGED[model]
+    cleaned = {row_id: _clean(tags) for row_id, tags in tags_by_id.items()}
+    ids = _tag_ids(db, {slug: name for names in cleaned.values() for slug, name in names.items()})
+    db.execute(delete(table).where(column.in_(list(cleaned))))
+    links = [{column.key: row_id, "tag_id": ids[slug]} for row_id, names in cleaned.items() for slug in names]
+    if links:
+        db.execute(insert(table), links)
+
+def clear_tags(db: Session, model, ids: List[int]):
+    # Explicit because SQLite doesn't enforce ON DELETE CASCADE by default
+    table, column = TAGGED[model]
+    db.execute(delete(table).where(column.in_(ids)))
+
+def tag_writer(model):
+    """``after_write`` hook for bulk_insert / bulk_update"""
+    def after_write(db: Session, rows: List[dict]):
+        sync_tags(db, model, {row["id"]: row["tags"] for row in rows if "tags" in row})
+    return after_write
+
+def rebuild_tags(db: Session):
+    """Rebuild every tag link from the JSON columns (seeding, existing databases)"""
+    for model, (table, _) in TAGGED.items():
+        db.execute(delete(table))
+        sync_tags(db, model, dict(db.execute(select(model.id, model.tags)).all()))
+
+def tag_filter(model, tags: List[str], match: str = "any"):
+    """WHERE clause keeping ``model`` rows tagged with any (or all) of ``tags``.
+
+    Resolved through the tag slug and (tag_id, <model>_id) indexes, so the
+    cost follows the number of matching rows rather than the table size.
+    """
+    table, column = TAGGED[model]
+    slugs = list(_clean(tags))
+    matching = select(column).join(Tag, Tag.id == table.c.tag_id).where(Tag.slug.in_(slugs))
+    if match == "all":
+        matching = matching.group_by(column).having(func.count() == len(slugs))
+    return model.id.in_(matching)
+
+def tag_counts(db: Session, models) -> List[TagCount]:
+    """Tags in use by ``models`` with how many rows carry each, most used first"""
+    counts, names = {}, {}
+    for model in models:
+        table, _ = TAGGED[model]
+        query = (
+            select(Tag.id, Tag.name, func.count())
+            .join(table, table.c.tag_id == Tag.id)
+            .group_by(Tag.id, Tag.name)
+        )
+        for tag_id, name, count in db.execute(query):
+            names[tag_id] = name
+            counts[tag_id] = counts.get(tag_id, 0) + count
+    ranked = sorted(counts, key=lambda tag_id: (-counts[tag_id], names[tag_id].lower()))
+    return [TagCount(name=names[tag_id], count=counts[tag_id]) for tag_id in ranked]
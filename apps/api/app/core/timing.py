@@ -0,0 +1,227 @@
+"""
+Per-request timing, switched on with REQUEST_TIMING_ENABLED.
+
+Each request is split into phases, sent back in a ``Server-Timing`` header
+and aggregated into histograms served by ``GET /metrics``:
+
+- ``sql``: time inside the DBAPI cursor, plus the number of statements
+- ``orm``: the rest of the time spent in ``run_db``: building ORM objects
+  from rows, flushes and commits, connection checkout, threadpool hand-off
+- ``serialize``: Pydantic validation and JSON rendering, in ``cached()`` and
+  in FastAPI's ``response_model`` handling
+- ``handler``: endpoint time not accounted for by the phases above
+- ``total``: from the request reaching the app to the response headers
+
+When disabled nothing is installed: no middleware, no engine listeners and
+no endpoint wrappers; ``run_db`` and ``cached()`` only pay for one
+``ContextVar.get``.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Dict, Iterable, Optional, Tuple
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class RequestTiming:
+    """Accumulators for the request being served (see ``request_timing``)"""
+
+    __slots__ = ("route", "queries", "sql", "db", "serialize", "endpoint", "endpoint_end")
+
+    def __init__(self):
+        self.route: Optional[str] = None  # path template of the matched route
+        self.queries = 0
+        self.sql = 0.0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.endpoint = 0.0
+        self.endpoint_end: Optional[float] = None
+
+    def phases(self, start: float, end: float) -> Dict[str, float]:
+        # Whatever happens between the endpoint returning and the response
+        # starting is FastAPI validating and rendering the response_model
+        after_endpoint = end - self.endpoint_end if self.endpoint_end is not None else 0.0
+        return {
+            "sql": self.sql,
+            "orm": max(self.db - self.sql, 0.0),
+            "serialize": self.serialize + after_endpoint,
+            "handler": max(self.endpoint - self.db - self.serialize, 0.0),
+            "total": end - start,
+        }
+
+# Set by TimingMiddleware for the duration of a request; None when timing is off
+request_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+def _format(value: float) -> str:
+    return "+Inf" if math.isinf(value) else repr(float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class Histogram:
+    """Prometheus-style histogram, one series per combination of label values"""
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series = {}  # label values -> [per-bucket counts, sum]
+
+    def observe(self, values: Tuple[str, ...], amount: float):
+        series = self._series.get(values)
+        if series is None:
+            series = self._series[values] = [[0] * len(self.buckets), 0.0]
+        series[0][bisect_left(self.buckets, amount)] += 1
+        series[1] += amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for values, (counts, total) in sorted(self._series.items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labels, values))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f'{self.name}_bucket{{{labels},le="{_format(bound)}"}} {cumulative}'
+            yield f"{self.name}_sum{{{labels}}} {_format(total)}"
+            yield f"{self.name}_count{{{labels}}} {cumulative}"
+
+class RequestMetrics:
+    """Histograms of every timed request, by method and route template"""
+
+    def __init__(self):
+        self.phases = Histogram(
+            "http_request_phase_seconds",
+            "Time spent in each phase of a request (sql, orm, serialize, handler, total).",
+            ("method", "route", "phase"),
+            (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+        )
+        self.queries = Histogram(
+            "http_request_sql_queries",
+            "SQL statements executed per request.",
+            ("method", "route"),
+            (0, 1, 2, 3, 5, 10, 20, 50, 100),
+        )
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: Optional[str], phases: Dict[str, float], queries: int):
+        route = route or "unmatched"
+        with self._lock:
+            for phase, seconds in phases.items():
+                self.phases.observe((method, route, phase), seconds)
+            self.queries.observe((method, route), queries)
+
+    def render(self) -> str:
+        with self._lock:
+            return "\n".join([*self.phases.render(), *self.queries.render()]) + "\n"
+
+request_metrics = RequestMetrics()
+
+def server_timing(phases: Dict[str, float], queries: int) -> str:
+    entries = []
+    for phase, seconds in phases.items():
+        entry = f"{phase};dur={seconds * 1000:.3f}"
+        if phase == "sql":
+            entry += f';desc="{queries} queries"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+class TimingMiddleware:
+    """ASGI middleware timing each HTTP request into ``request_metrics``.
+
+    Plain ASGI rather than BaseHTTPMiddleware so the endpoint runs in the
+    same task and sees the ``request_timing`` context variable.
+    """
+
+    def __init__(self, app, header: bool = True):
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        timing = RequestTiming()
+        token = request_timing.set(timing)
+        start = time.perf_counter()
+        phases = None
+
+        async def send_with_timing(message):
+            nonlocal phases
+            if message["type"] == "http.response.start":
+                phases = timing.phases(start, time.perf_counter())
+                if self.header:
+                    MutableHeaders(scope=message).append("Server-Timing", server_timing(phases, timing.queries))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_timing.reset(token)
+            if phases is not None:
+                request_metrics.observe(scope["method"], timing.route, phases, timing.queries)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if request_timing.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timing = request_timing.get()
+    if timing is not None and conn.info.get("query_start"):
+        timing.queries += 1
+        timing.sql += time.perf_counter() - conn.info["query_start"].pop()
+
+def _timed_endpoint(call, path: str):
+    """Wrap an endpoint so its run time (and route template) lands on the request's timing"""
+
+    def finish(timing: RequestTiming, start: float):
+        timing.endpoint_end = time.perf_counter()
+        timing.endpoint += timing.endpoint_end - start
+
+    # Keep the sync/async flavour: FastAPI runs sync endpoints in the threadpool
+    if iscoroutinefunction(call):
+        @wraps(call)
+        async def endpoint(*args, **kwargs):
+            timing = request_timing.get()
+            if timing is None:
+                return await call(*args, **kwargs)
+            timing.route = path
+            start = time.perf_counter()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                finish(timing, start)
+    else:
+        @wraps(call)
+        def endpoint(*args, **kwargs):
+            timing = request_timing.get()
+            if timing is None:
+                return call(*args, **kwargs)
+            timing.route = path
+            start = time.perf_counter()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                finish(timing, start)
+    return endpoint
+
+def instrument(app, engines: Iterable, header: bool = True):
+    """Install request timing on ``app``: call once every router is included"""
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    for route in app.routes:
+        # The request handler was built around this Dependant and looks up
+        # .call on every request, so swapping it here is enough
+        if isinstance(route, APIRoute):
+            route.dependant.call = _timed_endpoint(route.dependant.call, route.path)
+    app.add_middleware(TimingMiddleware, header=header)
@@ -24,20 +24,47 @@
 # def health_check():
 #     return {"status": "ok"}
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.database import Base, engine
-from app.routes import projects, experiences, contacts, skills, about, social_links
+from app.core.cache_sync import cache_sync
+from app.core.config import settings
+from app.core.database import all_engines, dispose_engines
+from app.core.ingest import contact_queue
+from app.core.lazyload import LazyLoadMiddleware, lazy_load_guard
+from app.core.timing import instrument
+from app.routes import projects, experiences, contacts, skills, about, social_links, portfolio, search, tags, snapshot, metrics
 # Import all models to ensure they're registered
 from app.models import Project, Experience, Skill, SkillCategory, Contact, About, Stat, SocialLink
 
+# Nothing here touches the database at import time: the schema is managed
+# by `python -m scripts.migrate`, run once per deploy rather than per worker
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background writer for queued contact submissions; drained on shutdown
+    if settings.CONTACT_QUEUE_ENABLED:
+        await contact_queue.start()
+    # Other workers' writes invalidate this worker's response cache
+    sync_cache = settings.RESPONSE_CACHE_ENABLED and settings.RESPONSE_CACHE_SYNC_SECONDS > 0
+    if sync_cache:
+        await cache_sync.start()
+    try:
+        yield
+    finally:
+        if sync_cache:
+            await cache_sync.stop()
+        if settings.CONTACT_QUEUE_ENABLED:
+            await contact_queue.stop()
+        await dispose_engines()
+
 app = FastAPI(
     title="Zakaria Portfolio API",
     description="Backend API powering Zakaria's portfolio (FastAPI + SQLAlchemy).",
     version="1.0.0",
     docs_url="/docs",           # Swagger UI
     redoc_url="/redoc",         # Optional: ReDoc alternative
-    openapi_url="/openapi.json" # Schema endpoint
+    openapi_url="/openapi.json", # Schema endpoint
+    lifespan=lifespan,
 )
 
 # Enable CORS (for frontend connection)
@@ -47,10 +74,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified", "Server-Timing"],
 )
 
-# Create DB tables
-Base.metadata.create_all(bind=engine)
+# Count lazy relationship loads per request to catch N+1 queries
+if settings.LAZY_LOAD_GUARD != "off":
+    app.add_middleware(LazyLoadMiddleware, guard=lazy_load_guard)
 
 # Include routers
 app.include_router(projects.router)
@@ -59,7 +88,16 @@ app.include_router(contacts.router)
 app.include_router(skills.router)
 app.include_router(about.router)
 app.include_router(social_links.router)
+app.include_router(portfolio.router)
+app.include_router(search.router)
+app.include_router(tags.router)
+app.include_router(snapshot.router)
+app.include_router(metrics.router)
 
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+# Last, so every route (including /health) gets timed
+if settings.REQUEST_TIMING_ENABLED:
+    instrument(app, all_engines().values(), header=settings.REQUEST_TIMING_HEADER)
@@ -4,6 +4,9 @@ from app.models.skill import Skill, SkillCategory
 from app.models.contact import Contact
 from app.models.about import About, Stat
 from app.models.social_link import SocialLink
+from app.models.tag import Tag, project_tags, experience_tags
+from app.models.cache_generation import CacheGeneration
+from app.models import search  # noqa: F401  (search indexes, SQLite FTS table)
 
-__all__ = ["Project", "Experience", "Skill", "SkillCategory", "Contact", "About", "Stat", "SocialLink"]
+__all__ = ["Project", "Experience", "Skill", "SkillCategory", "Contact", "About", "Stat", "SocialLink", "Tag", "project_tags", "experience_tags", "CacheGeneration"]
 
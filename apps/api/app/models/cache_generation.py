@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String, text
+from app.core.database import Base
+
+class CacheGeneration(Base):
+    """One row per response cache tag, bumped on every write to it (see app.core.cache_sync)"""
+    __tablename__ = "cache_generations"
+
+    tag = Column(String(100), primary_key=True)  # e.g. "projects"
+    generation = Column(Integer, nullable=False, default=0, server_default=text("0"))
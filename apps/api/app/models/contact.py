@@ -1,14 +1,17 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Index, Integer, String, Text
 from app.core.database import Base
+from app.models.mixins import TimestampMixin
 
-class Contact(Base):
+class Contact(TimestampMixin, Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Newest-first listing: ORDER BY created_at DESC, id DESC (scanned backwards)
+        Index("ix_contacts_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False)
     email = Column(String(200), nullable=False)
     message = Column(Text, nullable=False)
     status = Column(String(20), default="new")  # new, read, replied, archived
-    created_at = Column(String(50), nullable=True)
-    updated_at = Column(String(50), nullable=True)
 
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, JSON
+from sqlalchemy import Column, Index, Integer, String, Text, JSON, text
 from app.core.database import Base
+from app.models.mixins import TimestampMixin
 
-class Experience(Base):
+class Experience(TimestampMixin, Base):
     __tablename__ = "experiences"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY order_index, id
+        Index("ix_experiences_order_index_id", "order_index", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     role = Column(String(200), nullable=False)  # Job title/role
@@ -12,7 +17,5 @@ class Experience(Base):
     end_date = Column(String(50), nullable=True)  # End date (null if current)
     description = Column(Text, nullable=False)  # Job description
     tags = Column(JSON, nullable=True)  # Technologies/skills used as JSON array
-    order_index = Column(Integer, default=0)  # For custom ordering
-    created_at = Column(String(50), nullable=True)
-    updated_at = Column(String(50), nullable=True)
+    order_index = Column(Integer, nullable=False, default=0, server_default=text("0"))  # For custom ordering; NOT NULL for keyset pagination
 
@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, func
+
+def utcnow():
+    return datetime.now(timezone.utc)
+
+class TimestampMixin:
+    """created_at / updated_at maintained by the ORM, with database defaults for raw inserts"""
+
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
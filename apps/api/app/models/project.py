@@ -1,8 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, JSON
+from sqlalchemy import Boolean, Column, Index, Integer, String, Text, JSON, false, text
 from app.core.database import Base
+from app.models.mixins import TimestampMixin
 
-class Project(Base):
+class Project(TimestampMixin, Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY order_index, id
+        Index("ix_projects_order_index_id", "order_index", "id"),
+        # Featured widget: same ordering, but only the handful of featured rows.
+        # The predicate must match what the query renders (Project.featured == true())
+        Index(
+            "ix_projects_featured_order_index_id", "order_index", "id",
+            postgresql_where=text("featured = true"),
+            sqlite_where=text("featured = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
@@ -11,7 +23,5 @@ class Project(Base):
     tags = Column(JSON, nullable=True)  # Array of technology tags as JSON
     live_url = Column(String(500), nullable=True)  # Live demo URL
     github_url = Column(String(500), nullable=True)  # GitHub repository URL
-    featured = Column(String(10), default="false")  # Whether to show in featured section
-    order_index = Column(Integer, default=0)  # For custom ordering
-    created_at = Column(String(50), nullable=True)  # Timestamp
-    updated_at = Column(String(50), nullable=True)  # Timestamp
+    featured = Column(Boolean, nullable=False, default=False, server_default=false())  # Whether to show in featured section
+    order_index = Column(Integer, nullable=False, default=0, server_default=text("0"))  # For custom ordering; NOT NULL for keyset pagination
@@ -0,0 +1,109 @@
+"""
+Full-text search documents for projects, experiences and skills.
+
+PostgreSQL: each table gets a GIN index over a weighted ``tsvector``
+expression, and ``/search`` queries that same expression, so nothing has to
+be kept in sync. SQLite (development): one FTS5 table, ``search_index``, kept
+current by triggers, so Core INSERT/UPDATE/DELETE and bulk writes are covered
+as well as ORM writes.
+"""
+
+from sqlalchemy import Index, Text, cast, event, func, literal_column
+from app.core.database import Base
+from app.models.experience import Experience
+from app.models.project import Project
+from app.models.skill import Skill
+
+SEARCH_CONFIG = "english"
+
+# Literal SQL rather than bound parameters: the planner only uses an
+# expression index when the query repeats the indexed expression verbatim
+_CONFIG = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+_EMPTY = literal_column("''")
+_SPACE = literal_column("' '")
+
+def _weighted(weight: str, *columns):
+    document = func.coalesce(columns[0], _EMPTY)
+    for column in columns[1:]:
+        # || rather than concat_ws(), which isn't IMMUTABLE and so can't be indexed
+        document = document.op("||")(_SPACE).op("||")(func.coalesce(column, _EMPTY))
+    return func.setweight(func.to_tsvector(_CONFIG, document), literal_column(f"'{weight}'"))
+
+def search_query(q: str):
+    """tsquery for free text typed by a user ("quoted phrases", or, -exclusions)"""
+    return func.websearch_to_tsquery(_CONFIG, q)
+
+# kind -> (model, title column, tsvector expression); weights A > B > C rank title matches first
+SEARCH_DOCUMENTS = {
+    "project": (
+        Project,
+        Project.title,
+        _weighted("A", Project.title)
+        .op("||")(_weighted("B", cast(Project.tags, Text)))
+        .op("||")(_weighted("C", Project.description)),
+    ),
+    "experience": (
+        Experience,
+        Experience.role,
+        _weighted("A", Experience.role)
+        .op("||")(_weighted("B", Experience.company, cast(Experience.tags, Text)))
+        .op("||")(_weighted("C", Experience.description)),
+    ),
+    "skill": (Skill, Skill.name, _weighted("A", Skill.name)),
+}
+
+for model, _, vector in SEARCH_DOCUMENTS.values():
+    # Attached explicitly: the literal regconfig hides the table from Index().
+    # info["dialect"] lets the index scripts and autogenerate see the restriction.
+    model.__table__.append_constraint(
+        Index(
+            f"ix_{model.__tablename__}_search", vector, postgresql_using="gin", info={"dialect": "postgresql"},
+        ).ddl_if(dialect="postgresql")
+    )
+
+# SQLite FTS5 sources: (kind, table, title, body), with {row} standing for the row alias
+FTS_SOURCES = [
+    ("project", "projects", "{row}.title", "coalesce({row}.tags, '') || ' ' || {row}.description"),
+    ("experience", "experiences", "{row}.role", "{row}.company || ' ' || coalesce({row}.tags, '') || ' ' || {row}.description"),
+    ("skill", "skills", "{row}.name", "''"),
+]
+
+def create_fts_index(connection):
+    """Create the SQLite search_index table and its triggers, filling it on first creation"""
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+    ).first()
+    connection.exec_driver_sql(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index "
+        "USING fts5(kind UNINDEXED, ref_id UNINDEXED, title, body, tokenize='porter unicode61')"
+    )
+    for kind, table, title, body in FTS_SOURCES:
+        insert_new = (
+            f"INSERT INTO search_index (kind, ref_id, title, body) "
+            f"VALUES ('{kind}', NEW.id, {title.format(row='NEW')}, {body.format(row='NEW')});"
+        )
+        delete_old = f"DELETE FROM search_index WHERE kind = '{kind}' AND ref_id = OLD.id;"
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} BEGIN {insert_new} END"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} BEGIN {delete_old} END"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_au AFTER UPDATE ON {table} BEGIN {delete_old} {insert_new} END"
+        )
+        if not exists:
+            connection.exec_driver_sql(
+                f"INSERT INTO search_index (kind, ref_id, title, body) "
+                f"SELECT '{kind}', id, {title.format(row=table)}, {body.format(row=table)} FROM {table}"
+            )
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_fts(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        create_fts_index(connection)
+
+@event.listens_for(Base.metadata, "after_drop")
+def _drop_fts(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS search_index")
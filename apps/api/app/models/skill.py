@@ -1,29 +1,36 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.models.mixins import TimestampMixin
 
-class SkillCategory(Base):
+class SkillCategory(TimestampMixin, Base):
     __tablename__ = "skill_categories"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True)  # e.g., "Frontend", "Backend"
     order_index = Column(Integer, default=0)  # For custom ordering
-    created_at = Column(String(50), nullable=True)
-    updated_at = Column(String(50), nullable=True)
 
-    # Relationship to skills
-    skills = relationship("Skill", back_populates="category", cascade="all, delete-orphan")
+    # Relationship to skills, in display order whichever way they are loaded
+    skills = relationship(
+        "Skill",
+        back_populates="category",
+        cascade="all, delete-orphan",
+        order_by="[Skill.category_id, Skill.order_index, Skill.id]",
+    )
 
 
-class Skill(Base):
+class Skill(TimestampMixin, Base):
     __tablename__ = "skills"
+    __table_args__ = (
+        # Covers the category_id foreign key, per-category loads and the
+        # ORDER BY category_id, order_index, id listing
+        Index("ix_skills_category_id_order_index_id", "category_id", "order_index", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)  # Skill name
     category_id = Column(Integer, ForeignKey("skill_categories.id"), nullable=False)
-    order_index = Column(Integer, default=0)  # For custom ordering within category
-    created_at = Column(String(50), nullable=True)
-    updated_at = Column(String(50), nullable=True)
+    order_index = Column(Integer, nullable=False, default=0, server_default=text("0"))  # For custom ordering within category; NOT NULL for keyset pagination
 
     # Relationship to category
     category = relationship("SkillCategory", back_populates="skills")
@@ -1,7 +1,8 @@
 from sqlalchemy import Column, Integer, String
 from app.core.database import Base
+from app.models.mixins import TimestampMixin
 
-class SocialLink(Base):
+class SocialLink(TimestampMixin, Base):
     __tablename__ = "social_links"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -9,6 +10,4 @@ class SocialLink(Base):
     url = Column(String(500), nullable=False)  # Social media URL
     icon_name = Column(String(50), nullable=True)  # Icon identifier (e.g., "Github", "Linkedin")
     order_index = Column(Integer, default=0)
-    created_at = Column(String(50), nullable=True)
-    updated_at = Column(String(50), nullable=True)
 
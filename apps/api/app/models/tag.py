@@ -0,0 +1,29 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table
+from app.core.database import Base
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)  # Display form, as first written, e.g. "Next.js"
+    slug = Column(String(100), nullable=False, unique=True)  # Lower-cased name, used for matching
+
+
+# Normalized copies of Project.tags / Experience.tags (the JSON column stays
+# the source of truth for responses), kept in sync by app.core.tags
+project_tags = Table(
+    "project_tags",
+    Base.metadata,
+    Column("project_id", Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    # Tag filters and facet counts start from the tag
+    Index("ix_project_tags_tag_id_project_id", "tag_id", "project_id"),
+)
+
+experience_tags = Table(
+    "experience_tags",
+    Base.metadata,
+    Column("experience_id", Integer, ForeignKey("experiences.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_experience_tags_tag_id_experience_id", "tag_id", "experience_id"),
+)
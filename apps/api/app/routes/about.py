@@ -1,114 +1,202 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import Session
 from typing import List
-from app.core.database import get_db
+from app.core.database import AnySession, get_db, get_read_db, run_db
+from app.core.bulk import bulk_delete, bulk_insert, bulk_update, check_batch_size
+from app.core.cache import cached, response_cache
 from app.models.about import About, Stat
 from app.schemas.about import (
     About as AboutSchema, 
     AboutCreate, 
     AboutUpdate,
+    AboutBulkUpdate,
     Stat as StatSchema,
     StatCreate,
-    StatUpdate
+    StatUpdate,
+    StatBulkUpdate
 )
+from app.schemas.bulk import BulkDelete, BulkDeleteResult, BulkResult
 
 router = APIRouter(prefix="/about", tags=["About"])
 
-# About Content Routes
-@router.get("/content", response_model=List[AboutSchema])
-def get_about_content(db: Session = Depends(get_db)):
-    """Get all about content sections"""
+# Synchronous ORM work, executed through run_db
+def _list_about(db: Session):
     return db.query(About).order_by(About.order_index).all()
 
-@router.get("/content/{about_id}", response_model=AboutSchema)
-def get_about(about_id: int, db: Session = Depends(get_db)):
-    """Get a specific about section by ID"""
+def _get_about(db: Session, about_id: int):
     about = db.query(About).filter(About.id == about_id).first()
     if not about:
         raise HTTPException(status_code=404, detail="About section not found")
     return about
 
-@router.post("/content", response_model=AboutSchema, status_code=201)
-def create_about(about: AboutCreate, db: Session = Depends(get_db)):
-    """Create a new about section"""
-    db_about = About(**about.model_dump())
-    db.add(db_about)
+def _create_about(db: Session, about: AboutCreate):
+    db_about = db.scalar(insert(About).values(**about.model_dump()).returning(About))
     db.commit()
-    db.refresh(db_about)
     return db_about
 
-@router.put("/content/{about_id}", response_model=AboutSchema)
-def update_about(about_id: int, about: AboutUpdate, db: Session = Depends(get_db)):
-    """Update an about section"""
-    db_about = db.query(About).filter(About.id == about_id).first()
-    if not db_about:
-        raise HTTPException(status_code=404, detail="About section not found")
-    
+def _update_about(db: Session, about_id: int, about: AboutUpdate):
     update_data = about.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_about, field, value)
+    if not update_data:
+        return _get_about(db, about_id)
     
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_about = db.scalar(update(About).where(About.id == about_id).values(**update_data).returning(About))
+    if not db_about:
+        raise HTTPException(status_code=404, detail="About section not found")
     db.commit()
-    db.refresh(db_about)
     return db_about
 
-@router.delete("/content/{about_id}", status_code=204)
-def delete_about(about_id: int, db: Session = Depends(get_db)):
-    """Delete an about section"""
-    db_about = db.query(About).filter(About.id == about_id).first()
-    if not db_about:
+def _delete_about(db: Session, about_id: int):
+    if db.scalar(delete(About).where(About.id == about_id).returning(About.id)) is None:
         raise HTTPException(status_code=404, detail="About section not found")
+    db.commit()
+
+def _list_stats(db: Session):
+    return db.query(Stat).order_by(Stat.order_index).all()
+
+def _get_stat(db: Session, stat_id: int):
+    stat = db.query(Stat).filter(Stat.id == stat_id).first()
+    if not stat:
+        raise HTTPException(status_code=404, detail="Stat not found")
+    return stat
+
+def _create_stat(db: Session, stat: StatCreate):
+    db_stat = db.scalar(insert(Stat).values(**stat.model_dump()).returning(Stat))
+    db.commit()
+    return db_stat
+
+def _update_stat(db: Session, stat_id: int, stat: StatUpdate):
+    update_data = stat.model_dump(exclude_unset=True)
+    if not update_data:
+        return _get_stat(db, stat_id)
     
-    db.delete(db_about)
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_stat = db.scalar(update(Stat).where(Stat.id == stat_id).values(**update_data).returning(Stat))
+    if not db_stat:
+        raise HTTPException(status_code=404, detail="Stat not found")
     db.commit()
+    return db_stat
+
+def _delete_stat(db: Session, stat_id: int):
+    if db.scalar(delete(Stat).where(Stat.id == stat_id).returning(Stat.id)) is None:
+        raise HTTPException(status_code=404, detail="Stat not found")
+    db.commit()
+
+# About Content Routes
+@router.get("/content", response_model=List[AboutSchema])
+@cached("about", schema=List[AboutSchema])
+async def get_about_content(db: AnySession = Depends(get_read_db)):
+    """Get all about content sections"""
+    return await run_db(db, _list_about)
+
+# Bulk About Content Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/content/bulk", response_model=BulkResult[AboutSchema])
+async def create_about_sections_bulk(sections: List[AboutCreate], db: AnySession = Depends(get_db)):
+    """Create many about sections in one transaction, reporting failures per item"""
+    check_batch_size(sections)
+    result = await run_db(db, bulk_insert, About, AboutSchema, [section.model_dump() for section in sections])
+    response_cache.invalidate("about")
+    return result
+
+@router.patch("/content/bulk", response_model=BulkResult[AboutSchema])
+async def update_about_sections_bulk(sections: List[AboutBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many about sections in one transaction, reporting failures per item"""
+    check_batch_size(sections)
+    result = await run_db(db, bulk_update, About, AboutSchema, [section.model_dump(exclude_unset=True) for section in sections], "About section not found")
+    response_cache.invalidate("about")
+    return result
+
+@router.delete("/content/bulk", response_model=BulkDeleteResult)
+async def delete_about_sections_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many about sections in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, About, body.ids, "About section not found")
+    response_cache.invalidate("about")
+    return result
+
+@router.get("/content/{about_id}", response_model=AboutSchema)
+@cached("about", schema=AboutSchema)
+async def get_about(about_id: int, db: AnySession = Depends(get_read_db)):
+    """Get a specific about section by ID"""
+    return await run_db(db, _get_about, about_id)
+
+@router.post("/content", response_model=AboutSchema, status_code=201)
+async def create_about(about: AboutCreate, db: AnySession = Depends(get_db)):
+    """Create a new about section"""
+    db_about = await run_db(db, _create_about, about)
+    response_cache.invalidate("about")
+    return db_about
+
+@router.put("/content/{about_id}", response_model=AboutSchema)
+async def update_about(about_id: int, about: AboutUpdate, db: AnySession = Depends(get_db)):
+    """Update an about section"""
+    db_about = await run_db(db, _update_about, about_id, about)
+    response_cache.invalidate("about")
+    return db_about
+
+@router.delete("/content/{about_id}", status_code=204)
+async def delete_about(about_id: int, db: AnySession = Depends(get_db)):
+    """Delete an about section"""
+    await run_db(db, _delete_about, about_id)
+    response_cache.invalidate("about")
     return None
 
 # Stats Routes
 @router.get("/stats", response_model=List[StatSchema])
-def get_stats(db: Session = Depends(get_db)):
+@cached("stats", schema=List[StatSchema])
+async def get_stats(db: AnySession = Depends(get_read_db)):
     """Get all stats"""
-    return db.query(Stat).order_by(Stat.order_index).all()
+    return await run_db(db, _list_stats)
+
+# Bulk Stat Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/stats/bulk", response_model=BulkResult[StatSchema])
+async def create_stats_bulk(stats: List[StatCreate], db: AnySession = Depends(get_db)):
+    """Create many stats in one transaction, reporting failures per item"""
+    check_batch_size(stats)
+    result = await run_db(db, bulk_insert, Stat, StatSchema, [stat.model_dump() for stat in stats])
+    response_cache.invalidate("stats")
+    return result
+
+@router.patch("/stats/bulk", response_model=BulkResult[StatSchema])
+async def update_stats_bulk(stats: List[StatBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many stats in one transaction, reporting failures per item"""
+    check_batch_size(stats)
+    result = await run_db(db, bulk_update, Stat, StatSchema, [stat.model_dump(exclude_unset=True) for stat in stats], "Stat not found")
+    response_cache.invalidate("stats")
+    return result
+
+@router.delete("/stats/bulk", response_model=BulkDeleteResult)
+async def delete_stats_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many stats in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, Stat, body.ids, "Stat not found")
+    response_cache.invalidate("stats")
+    return result
 
 @router.get("/stats/{stat_id}", response_model=StatSchema)
-def get_stat(stat_id: int, db: Session = Depends(get_db)):
+@cached("stats", schema=StatSchema)
+async def get_stat(stat_id: int, db: AnySession = Depends(get_read_db)):
     """Get a specific stat by ID"""
-    stat = db.query(Stat).filter(Stat.id == stat_id).first()
-    if not stat:
-        raise HTTPException(status_code=404, detail="Stat not found")
-    return stat
+    return await run_db(db, _get_stat, stat_id)
 
 @router.post("/stats", response_model=StatSchema, status_code=201)
-def create_stat(stat: StatCreate, db: Session = Depends(get_db)):
+async def create_stat(stat: StatCreate, db: AnySession = Depends(get_db)):
     """Create a new stat"""
-    db_stat = Stat(**stat.model_dump())
-    db.add(db_stat)
-    db.commit()
-    db.refresh(db_stat)
+    db_stat = await run_db(db, _create_stat, stat)
+    response_cache.invalidate("stats")
     return db_stat
 
 @router.put("/stats/{stat_id}", response_model=StatSchema)
-def update_stat(stat_id: int, stat: StatUpdate, db: Session = Depends(get_db)):
+async def update_stat(stat_id: int, stat: StatUpdate, db: AnySession = Depends(get_db)):
     """Update a stat"""
-    db_stat = db.query(Stat).filter(Stat.id == stat_id).first()
-    if not db_stat:
-        raise HTTPException(status_code=404, detail="Stat not found")
-    
-    update_data = stat.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_stat, field, value)
-    
-    db.commit()
-    db.refresh(db_stat)
+    db_stat = await run_db(db, _update_stat, stat_id, stat)
+    response_cache.invalidate("stats")
     return db_stat
 
 @router.delete("/stats/{stat_id}", status_code=204)
-def delete_stat(stat_id: int, db: Session = Depends(get_db)):
+async def delete_stat(stat_id: int, db: AnySession = Depends(get_db)):
     """Delete a stat"""
-    db_stat = db.query(Stat).filter(Stat.id == stat_id).first()
-    if not db_stat:
-        raise HTTPException(status_code=404, detail="Stat not found")
-    
-    db.delete(db_stat)
-    db.commit()
+    await run_db(db, _delete_stat, stat_id)
+    response_cache.invalidate("stats")
     return None
-
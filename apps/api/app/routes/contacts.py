@@ -1,57 +1,99 @@
-from fastapi import APIRouter, Depends, HTTPException
+from contextlib import nullcontext
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import Session
 from typing import List
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import AnySession, get_db, get_read_db, run_db
+from app.core.bulk import bulk_delete, bulk_update, check_batch_size
+from app.core.ingest import QueueFull, contact_queue, contact_row
+from app.core.pagination import PageParams, keyset_paginate, page_params, page_response
+from app.core.ratelimit import contact_guard
 from app.models.contact import Contact
-from app.schemas.contact import Contact as ContactSchema, ContactCreate, ContactUpdate
+from app.schemas.contact import Contact as ContactSchema, ContactCreate, ContactUpdate, ContactBulkUpdate, ContactQueued
+from app.schemas.bulk import BulkDelete, BulkDeleteResult, BulkResult
 
 router = APIRouter(prefix="/contacts", tags=["Contacts"])
 
-@router.get("/", response_model=List[ContactSchema])
-def get_contacts(db: Session = Depends(get_db)):
-    """Get all contacts"""
-    return db.query(Contact).order_by(Contact.created_at.desc()).all()
+# Synchronous ORM work, executed through run_db
+def _list_contacts(db: Session, page: PageParams):
+    return keyset_paginate(db.query(Contact), Contact, [(Contact.created_at, True), (Contact.id, True)], page, ContactSchema)
 
-@router.get("/{contact_id}", response_model=ContactSchema)
-def get_contact(contact_id: int, db: Session = Depends(get_db)):
-    """Get a specific contact by ID"""
+def _get_contact(db: Session, contact_id: int):
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
     return contact
 
-@router.post("/", response_model=ContactSchema, status_code=201)
-def create_contact(contact: ContactCreate, db: Session = Depends(get_db)):
-    """Create a new contact submission"""
-    db_contact = Contact(**contact.model_dump())
-    db.add(db_contact)
+def _create_contact(db: Session, contact: ContactCreate):
+    db_contact = db.scalar(insert(Contact).values(**contact.model_dump()).returning(Contact))
     db.commit()
-    db.refresh(db_contact)
     return db_contact
 
-@router.put("/{contact_id}", response_model=ContactSchema)
-def update_contact(contact_id: int, contact: ContactUpdate, db: Session = Depends(get_db)):
-    """Update contact status"""
-    db_contact = db.query(Contact).filter(Contact.id == contact_id).first()
-    if not db_contact:
-        raise HTTPException(status_code=404, detail="Contact not found")
-    
+def _update_contact(db: Session, contact_id: int, contact: ContactUpdate):
     update_data = contact.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_contact, field, value)
+    if not update_data:
+        return _get_contact(db, contact_id)
     
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_contact = db.scalar(update(Contact).where(Contact.id == contact_id).values(**update_data).returning(Contact))
+    if not db_contact:
+        raise HTTPException(status_code=404, detail="Contact not found")
     db.commit()
-    db.refresh(db_contact)
     return db_contact
 
-@router.delete("/{contact_id}", status_code=204)
-def delete_contact(contact_id: int, db: Session = Depends(get_db)):
-    """Delete a contact"""
-    db_contact = db.query(Contact).filter(Contact.id == contact_id).first()
-    if not db_contact:
+def _delete_contact(db: Session, contact_id: int):
+    if db.scalar(delete(Contact).where(Contact.id == contact_id).returning(Contact.id)) is None:
         raise HTTPException(status_code=404, detail="Contact not found")
-    
-    db.delete(db_contact)
     db.commit()
-    return None
 
+@router.get("/", response_model=List[ContactSchema])
+async def get_contacts(response: Response, page: PageParams = Depends(page_params), db: AnySession = Depends(get_read_db)):
+    """Get contacts, newest first, one page at a time"""
+    return page_response(await run_db(db, _list_contacts, page), response)
+
+# Bulk Contact Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.patch("/bulk", response_model=BulkResult[ContactSchema])
+async def update_contacts_bulk(contacts: List[ContactBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many contacts in one transaction, reporting failures per item"""
+    check_batch_size(contacts)
+    result = await run_db(db, bulk_update, Contact, ContactSchema, [contact.model_dump(exclude_unset=True) for contact in contacts], "Contact not found")
+    return result
+
+@router.delete("/bulk", response_model=BulkDeleteResult)
+async def delete_contacts_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many contacts in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, Contact, body.ids, "Contact not found")
+    return result
+
+@router.get("/{contact_id}", response_model=ContactSchema)
+async def get_contact(contact_id: int, db: AnySession = Depends(get_read_db)):
+    """Get a specific contact by ID"""
+    return await run_db(db, _get_contact, contact_id)
+
+@router.post("/", response_model=ContactSchema, status_code=201, responses={202: {"model": ContactQueued}})
+async def create_contact(contact: ContactCreate, request: Request, db: AnySession = Depends(get_db)):
+    """Create a new contact submission (queued with a 202 when CONTACT_QUEUE_ENABLED)"""
+    guard = contact_guard.admit(request, contact) if settings.CONTACT_RATE_LIMIT_ENABLED else nullcontext()
+    # A 503 or 500 raised in here is refunded by the guard, so the retry isn't a 409
+    async with guard:
+        if settings.CONTACT_QUEUE_ENABLED:
+            try:
+                submission_id = contact_queue.submit(contact_row(contact))
+            except QueueFull:
+                raise HTTPException(status_code=503, detail="Too many submissions, try again shortly", headers={"Retry-After": "1"})
+            return JSONResponse(ContactQueued(id=submission_id).model_dump(), status_code=202)
+        return await run_db(db, _create_contact, contact)
+
+@router.put("/{contact_id}", response_model=ContactSchema)
+async def update_contact(contact_id: int, contact: ContactUpdate, db: AnySession = Depends(get_db)):
+    """Update contact status"""
+    return await run_db(db, _update_contact, contact_id, contact)
+
+@router.delete("/{contact_id}", status_code=204)
+async def delete_contact(contact_id: int, db: AnySession = Depends(get_db)):
+    """Delete a contact"""
+    await run_db(db, _delete_contact, contact_id)
+    return None
@@ -1,57 +1,116 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from typing import List, Literal, Optional
+from app.core.database import AnySession, get_db, get_read_db, run_db
+from app.core.bulk import bulk_delete, bulk_insert, bulk_update, check_batch_size
+from app.core.cache import cached, response_cache
+from app.core.pagination import PageParams, keyset_paginate, page_params
+from app.core.tags import TAGGED, clear_tags, sync_tags, tag_filter, tag_writer
 from app.models.experience import Experience
-from app.schemas.experience import Experience as ExperienceSchema, ExperienceCreate, ExperienceUpdate
+from app.schemas.experience import Experience as ExperienceSchema, ExperienceCreate, ExperienceUpdate, ExperienceBulkUpdate
+from app.schemas.bulk import BulkDelete, BulkDeleteResult, BulkResult
 
 router = APIRouter(prefix="/experiences", tags=["Experiences"])
 
-@router.get("/", response_model=List[ExperienceSchema])
-def get_experiences(db: Session = Depends(get_db)):
-    """Get all experiences ordered by order_index"""
-    return db.query(Experience).order_by(Experience.order_index).all()
+# Synchronous ORM work, executed through run_db
+def _list_experiences(db: Session, page: PageParams, tags: Optional[List[str]] = None, match: str = "any"):
+    query = db.query(Experience)
+    if tags:
+        query = query.filter(tag_filter(Experience, tags, match))
+    return keyset_paginate(query, Experience, [(Experience.order_index, False), (Experience.id, False)], page, ExperienceSchema)
 
-@router.get("/{experience_id}", response_model=ExperienceSchema)
-def get_experience(experience_id: int, db: Session = Depends(get_db)):
-    """Get a specific experience by ID"""
+def _get_experience(db: Session, experience_id: int):
     experience = db.query(Experience).filter(Experience.id == experience_id).first()
     if not experience:
         raise HTTPException(status_code=404, detail="Experience not found")
     return experience
 
-@router.post("/", response_model=ExperienceSchema, status_code=201)
-def create_experience(experience: ExperienceCreate, db: Session = Depends(get_db)):
-    """Create a new experience"""
-    db_experience = Experience(**experience.model_dump())
-    db.add(db_experience)
+def _create_experience(db: Session, experience: ExperienceCreate):
+    db_experience = db.scalar(insert(Experience).values(**experience.model_dump()).returning(Experience))
+    sync_tags(db, Experience, {db_experience.id: db_experience.tags})
     db.commit()
-    db.refresh(db_experience)
     return db_experience
 
-@router.put("/{experience_id}", response_model=ExperienceSchema)
-def update_experience(experience_id: int, experience: ExperienceUpdate, db: Session = Depends(get_db)):
-    """Update an existing experience"""
-    db_experience = db.query(Experience).filter(Experience.id == experience_id).first()
-    if not db_experience:
-        raise HTTPException(status_code=404, detail="Experience not found")
-    
+def _update_experience(db: Session, experience_id: int, experience: ExperienceUpdate):
     update_data = experience.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_experience, field, value)
+    if not update_data:
+        return _get_experience(db, experience_id)
     
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_experience = db.scalar(update(Experience).where(Experience.id == experience_id).values(**update_data).returning(Experience))
+    if not db_experience:
+        raise HTTPException(status_code=404, detail="Experience not found")
+    if "tags" in update_data:
+        sync_tags(db, Experience, {experience_id: db_experience.tags})
     db.commit()
-    db.refresh(db_experience)
     return db_experience
 
-@router.delete("/{experience_id}", status_code=204)
-def delete_experience(experience_id: int, db: Session = Depends(get_db)):
-    """Delete an experience"""
-    db_experience = db.query(Experience).filter(Experience.id == experience_id).first()
-    if not db_experience:
+def _delete_experience(db: Session, experience_id: int):
+    clear_tags(db, Experience, [experience_id])
+    if db.scalar(delete(Experience).where(Experience.id == experience_id).returning(Experience.id)) is None:
         raise HTTPException(status_code=404, detail="Experience not found")
-    
-    db.delete(db_experience)
     db.commit()
-    return None
 
+@router.get("/", response_model=List[ExperienceSchema])
+@cached("experiences", schema=List[ExperienceSchema])
+async def get_experiences(
+    page: PageParams = Depends(page_params),
+    tag: Optional[List[str]] = Query(None, description="Only experiences with these tags (case-insensitive); repeatable"),
+    match: Literal["any", "all"] = Query("any", description="Require any or all of the given tags"),
+    db: AnySession = Depends(get_read_db),
+):
+    """Get experiences ordered by order_index, one page at a time"""
+    return await run_db(db, _list_experiences, page, tag, match)
+
+# Bulk Experience Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/bulk", response_model=BulkResult[ExperienceSchema])
+async def create_experiences_bulk(experiences: List[ExperienceCreate], db: AnySession = Depends(get_db)):
+    """Create many experiences in one transaction, reporting failures per item"""
+    check_batch_size(experiences)
+    result = await run_db(db, bulk_insert, Experience, ExperienceSchema, [experience.model_dump() for experience in experiences], after_write=tag_writer(Experience))
+    response_cache.invalidate("experiences")
+    return result
+
+@router.patch("/bulk", response_model=BulkResult[ExperienceSchema])
+async def update_experiences_bulk(experiences: List[ExperienceBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many experiences in one transaction, reporting failures per item"""
+    check_batch_size(experiences)
+    result = await run_db(db, bulk_update, Experience, ExperienceSchema, [experience.model_dump(exclude_unset=True) for experience in experiences], "Experience not found", after_write=tag_writer(Experience))
+    response_cache.invalidate("experiences")
+    return result
+
+@router.delete("/bulk", response_model=BulkDeleteResult)
+async def delete_experiences_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many experiences in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, Experience, body.ids, "Experience not found", children=[TAGGED[Experience]])
+    response_cache.invalidate("experiences")
+    return result
+
+@router.get("/{experience_id}", response_model=ExperienceSchema)
+@cached("experiences", schema=ExperienceSchema)
+async def get_experience(experience_id: int, db: AnySession = Depends(get_read_db)):
+    """Get a specific experience by ID"""
+    return await run_db(db, _get_experience, experience_id)
+
+@router.post("/", response_model=ExperienceSchema, status_code=201)
+async def create_experience(experience: ExperienceCreate, db: AnySession = Depends(get_db)):
+    """Create a new experience"""
+    db_experience = await run_db(db, _create_experience, experience)
+    response_cache.invalidate("experiences")
+    return db_experience
+
+@router.put("/{experience_id}", response_model=ExperienceSchema)
+async def update_experience(experience_id: int, experience: ExperienceUpdate, db: AnySession = Depends(get_db)):
+    """Update an existing experience"""
+    db_experience = await run_db(db, _update_experience, experience_id, experience)
+    response_cache.invalidate("experiences")
+    return db_experience
+
+@router.delete("/{experience_id}", status_code=204)
+async def delete_experience(experience_id: int, db: AnySession = Depends(get_db)):
+    """Delete an experience"""
+    await run_db(db, _delete_experience, experience_id)
+    response_cache.invalidate("experiences")
+    return None
@@ -0,0 +1,46 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.cache import response_cache, search_cache
+from app.core.cache_sync import cache_sync
+from app.core.database import pool_status, read_router
+from app.core.ingest import contact_queue
+from app.core.lazyload import lazy_load_guard
+from app.core.ratelimit import contact_guard
+from app.core.timing import PROMETHEUS_CONTENT_TYPE, request_metrics
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+@router.get("", response_class=PlainTextResponse)
+def get_request_metrics():
+    """Get per-route request timing histograms (Prometheus text format, needs REQUEST_TIMING_ENABLED)"""
+    return PlainTextResponse(request_metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@router.get("/cache")
+def get_cache_metrics():
+    """Get response cache hit/miss counters (the /search cache under "search", cross-worker invalidation under "sync")"""
+    return {**response_cache.stats(), "search": search_cache.stats(), "sync": cache_sync.stats()}
+
+@router.get("/pool")
+def get_pool_metrics():
+    """Get database connection pool usage and checkout wait times"""
+    return pool_status()
+
+@router.get("/replicas")
+def get_replica_metrics():
+    """Get how read sessions were routed across the primary and the read replicas"""
+    return read_router.stats()
+
+@router.get("/ingest")
+def get_ingest_metrics():
+    """Get contact ingestion queue depth and batch write counters"""
+    return contact_queue.stats()
+
+@router.get("/ratelimit")
+def get_ratelimit_metrics():
+    """Get contact rate-limit and dedupe rejection counters"""
+    return contact_guard.stats()
+
+@router.get("/lazyloads")
+def get_lazyload_metrics():
+    """Get routes that lazy-loaded a relationship past the N+1 threshold"""
+    return lazy_load_guard.stats()
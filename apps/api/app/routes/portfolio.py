@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.core.database import AnySession, get_read_db, run_db
+from app.core.cache import cached
+from app.models.project import Project
+from app.models.experience import Experience
+from app.models.about import About, Stat
+from app.models.social_link import SocialLink
+from app.routes.skills import _list_categories
+from app.schemas.portfolio import Portfolio
+
+router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
+
+def _load_portfolio(db: Session):
+    # Read all collections from one snapshot so the document is consistent.
+    # SQLite serializes writers already, Postgres needs REPEATABLE READ.
+    if db.get_bind().dialect.name != "sqlite":
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    return Portfolio(
+        projects=db.query(Project).order_by(Project.order_index).all(),
+        experiences=db.query(Experience).order_by(Experience.order_index).all(),
+        skill_categories=_list_categories(db),
+        about=db.query(About).order_by(About.order_index).all(),
+        stats=db.query(Stat).order_by(Stat.order_index).all(),
+        social_links=db.query(SocialLink).order_by(SocialLink.order_index).all(),
+    )
+
+@router.get("/", response_model=Portfolio)
+@cached("projects", "experiences", "skills", "about", "stats", "social_links", schema=Portfolio)
+async def get_portfolio(db: AnySession = Depends(get_read_db)):
+    """Get every public collection in a single request"""
+    return await run_db(db, _load_portfolio)
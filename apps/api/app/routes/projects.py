@@ -1,56 +1,127 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete, false, insert, true, update
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from typing import List, Literal, Optional
+from app.core.database import AnySession, get_db, get_read_db, run_db
+from app.core.bulk import bulk_delete, bulk_insert, bulk_update, check_batch_size
+from app.core.cache import cached, response_cache
+from app.core.pagination import PageParams, keyset_paginate, page_params
+from app.core.tags import TAGGED, clear_tags, sync_tags, tag_filter, tag_writer
 from app.models.project import Project
-from app.schemas.project import Project as ProjectSchema, ProjectCreate, ProjectUpdate
+from app.schemas.project import Project as ProjectSchema, ProjectCreate, ProjectUpdate, ProjectBulkUpdate
+from app.schemas.bulk import BulkDelete, BulkDeleteResult, BulkResult
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
-@router.get("/", response_model=List[ProjectSchema])
-def get_projects(db: Session = Depends(get_db)):
-    """Get all projects ordered by order_index"""
-    return db.query(Project).order_by(Project.order_index).all()
+# Synchronous ORM work, executed through run_db
+def _list_projects(db: Session, page: PageParams, tags: Optional[List[str]] = None, match: str = "any",
+                   featured: Optional[bool] = None):
+    query = db.query(Project)
+    if featured is not None:
+        # == true() matches the partial index predicate (IS would not)
+        query = query.filter(Project.featured == (true() if featured else false()))
+    if tags:
+        query = query.filter(tag_filter(Project, tags, match))
+    return keyset_paginate(query, Project, [(Project.order_index, False), (Project.id, False)], page, ProjectSchema)
 
-@router.get("/{project_id}", response_model=ProjectSchema)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    """Get a specific project by ID"""
+def _get_project(db: Session, project_id: int):
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
-@router.post("/", response_model=ProjectSchema, status_code=201)
-def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
-    """Create a new project"""
-    db_project = Project(**project.model_dump())
-    db.add(db_project)
+def _create_project(db: Session, project: ProjectCreate):
+    db_project = db.scalar(insert(Project).values(**project.model_dump()).returning(Project))
+    sync_tags(db, Project, {db_project.id: db_project.tags})
     db.commit()
-    db.refresh(db_project)
     return db_project
 
-@router.put("/{project_id}", response_model=ProjectSchema)
-def update_project(project_id: int, project: ProjectUpdate, db: Session = Depends(get_db)):
-    """Update an existing project"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
+def _update_project(db: Session, project_id: int, project: ProjectUpdate):
     update_data = project.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_project, field, value)
+    if not update_data:
+        return _get_project(db, project_id)
     
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_project = db.scalar(update(Project).where(Project.id == project_id).values(**update_data).returning(Project))
+    if not db_project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if "tags" in update_data:
+        sync_tags(db, Project, {project_id: db_project.tags})
     db.commit()
-    db.refresh(db_project)
     return db_project
 
-@router.delete("/{project_id}", status_code=204)
-def delete_project(project_id: int, db: Session = Depends(get_db)):
-    """Delete a project"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
+def _delete_project(db: Session, project_id: int):
+    clear_tags(db, Project, [project_id])
+    if db.scalar(delete(Project).where(Project.id == project_id).returning(Project.id)) is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    
-    db.delete(db_project)
     db.commit()
+
+@router.get("/", response_model=List[ProjectSchema])
+@cached("projects", schema=List[ProjectSchema])
+async def get_projects(
+    page: PageParams = Depends(page_params),
+    tag: Optional[List[str]] = Query(None, description="Only projects with these tags (case-insensitive); repeatable"),
+    match: Literal["any", "all"] = Query("any", description="Require any or all of the given tags"),
+    featured: Optional[bool] = Query(None, description="Only featured (true) or non-featured (false) projects"),
+    db: AnySession = Depends(get_read_db),
+):
+    """Get projects ordered by order_index, one page at a time"""
+    return await run_db(db, _list_projects, page, tag, match, featured)
+
+@router.get("/featured", response_model=List[ProjectSchema])
+@cached("projects", schema=List[ProjectSchema])
+async def get_featured_projects(page: PageParams = Depends(page_params), db: AnySession = Depends(get_read_db)):
+    """Get featured projects ordered by order_index (the hero section), one page at a time"""
+    return await run_db(db, _list_projects, page, None, "any", True)
+
+# Bulk Project Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/bulk", response_model=BulkResult[ProjectSchema])
+async def create_projects_bulk(projects: List[ProjectCreate], db: AnySession = Depends(get_db)):
+    """Create many projects in one transaction, reporting failures per item"""
+    check_batch_size(projects)
+    result = await run_db(db, bulk_insert, Project, ProjectSchema, [project.model_dump() for project in projects], after_write=tag_writer(Project))
+    response_cache.invalidate("projects")
+    return result
+
+@router.patch("/bulk", response_model=BulkResult[ProjectSchema])
+async def update_projects_bulk(projects: List[ProjectBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many projects in one transaction, reporting failures per item"""
+    check_batch_size(projects)
+    result = await run_db(db, bulk_update, Project, ProjectSchema, [project.model_dump(exclude_unset=True) for project in projects], "Project not found", after_write=tag_writer(Project))
+    response_cache.invalidate("projects")
+    return result
+
+@router.delete("/bulk", response_model=BulkDeleteResult)
+async def delete_projects_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many projects in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, Project, body.ids, "Project not found", children=[TAGGED[Project]])
+    response_cache.invalidate("projects")
+    return result
+
+@router.get("/{project_id}", response_model=ProjectSchema)
+@cached("projects", schema=ProjectSchema)
+async def get_project(project_id: int, db: AnySession = Depends(get_read_db)):
+    """Get a specific project by ID"""
+    return await run_db(db, _get_project, project_id)
+
+@router.post("/", response_model=ProjectSchema, status_code=201)
+async def create_project(project: ProjectCreate, db: AnySession = Depends(get_db)):
+    """Create a new project"""
+    db_project = await run_db(db, _create_project, project)
+    response_cache.invalidate("projects")
+    return db_project
+
+@router.put("/{project_id}", response_model=ProjectSchema)
+async def update_project(project_id: int, project: ProjectUpdate, db: AnySession = Depends(get_db)):
+    """Update an existing project"""
+    db_project = await run_db(db, _update_project, project_id, project)
+    response_cache.invalidate("projects")
+    return db_project
+
+@router.delete("/{project_id}", status_code=204)
+async def delete_project(project_id: int, db: AnySession = Depends(get_db)):
+    """Delete a project"""
+    await run_db(db, _delete_project, project_id)
+    response_cache.invalidate("projects")
     return None
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import column, func, literal_column, select, text, union_all
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.core.config import settings
+from app.core.database import AnySession, get_read_db, run_db
+from app.core.cache import cached, search_cache
+from app.core.pagination import PageParams, keyset_paginate
+from app.models.search import SEARCH_DOCUMENTS, search_query
+from app.schemas.search import SearchResult
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+def _postgres_matches(q: str, kinds: List[str]):
+    query = search_query(q)
+    selects = []
+    for kind in kinds:
+        model, title, vector = SEARCH_DOCUMENTS[kind]
+        # Same expression as the GIN index, so the @@ is an index scan
+        selects.append(
+            select(
+                literal_column(f"'{kind}'").label("type"),
+                model.id.label("id"),
+                title.label("title"),
+                func.ts_rank(vector, query).label("rank"),
+            ).where(vector.op("@@")(query))
+        )
+    return union_all(*selects).subquery("matches")
+
+def _fts5_query(q: str) -> str:
+    # Quote every term so user input can't inject FTS5 query syntax; terms are ANDed
+    return " ".join('"%s"' % term.replace('"', '""') for term in q.split())
+
+def _sqlite_matches(q: str, kinds: List[str]):
+    # bm25() is lower-is-better; negate it so rank sorts like ts_rank. Title hits weigh 10x.
+    kind_list = ", ".join("'%s'" % kind for kind in kinds)
+    return (
+        text(
+            "SELECT kind AS type, ref_id AS id, title, -bm25(search_index, 0, 0, 10.0, 1.0) AS rank "
+            f"FROM search_index WHERE search_index MATCH :q AND kind IN ({kind_list})"
+        )
+        .bindparams(q=_fts5_query(q))
+        .columns(column("type"), column("id"), column("title"), column("rank"))
+        .subquery("matches")
+    )
+
+def _search(db: Session, q: str, kinds: List[str], page: PageParams):
+    if db.get_bind().dialect.name == "sqlite":
+        matches = _sqlite_matches(q, kinds)
+    else:
+        matches = _postgres_matches(q, kinds)
+    keys = [(matches.c.rank, True), (matches.c.type, True), (matches.c.id, True)]
+    return keyset_paginate(db.query(matches), None, keys, page)
+
+@router.get("/", response_model=List[SearchResult])
+@cached("projects", "experiences", "skills", schema=List[SearchResult], cache=search_cache)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+    types: Optional[List[str]] = Query(None, alias="type", description="Restrict to project, experience and/or skill"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    limit: int = Query(20, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    db: AnySession = Depends(get_read_db),
+):
+    """Search projects, experiences and skills, best matches first"""
+    kinds = list(dict.fromkeys(types or SEARCH_DOCUMENTS))
+    unknown = [kind for kind in kinds if kind not in SEARCH_DOCUMENTS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown type: {', '.join(unknown)}")
+    if not q.split():
+        return []
+    return await run_db(db, _search, q, kinds, PageParams(cursor, limit, None))
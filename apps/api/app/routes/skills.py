@@ -1,127 +1,247 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List
-from app.core.database import get_db
+from app.core.database import AnySession, get_db, get_read_db, run_db
+from app.core.bulk import bulk_delete, bulk_insert, bulk_update, check_batch_size
+from app.core.cache import cached, response_cache
+from app.core.pagination import PageParams, keyset_paginate, page_params
 from app.models.skill import Skill, SkillCategory
 from app.schemas.skill import (
     Skill as SkillSchema, 
     SkillCreate, 
     SkillUpdate,
+    SkillBulkUpdate,
     SkillCategory as SkillCategorySchema,
     SkillCategoryCreate,
-    SkillCategoryUpdate
+    SkillCategoryUpdate,
+    SkillCategoryBulkUpdate
 )
+from app.schemas.bulk import BulkDelete, BulkDeleteResult, BulkResult
 
 router = APIRouter(prefix="/skills", tags=["Skills"])
 
+# Synchronous ORM work, executed through run_db
+def _list_categories(db: Session):
+    # selectinload: one query for the categories and one IN (...) query for
+    # their skills, instead of a categories x skills join repeating every
+    # category's columns on each of its skill rows
+    return (
+        db.query(SkillCategory)
+        .options(selectinload(SkillCategory.skills))
+        .order_by(SkillCategory.order_index, SkillCategory.id)
+        .all()
+    )
+
+def _get_category(db: Session, category_id: int):
+    category = db.query(SkillCategory).filter(SkillCategory.id == category_id).first()
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return category
+
+def _get_category_with_skills(db: Session, category_id: int):
+    category = db.query(SkillCategory).options(selectinload(SkillCategory.skills)).filter(SkillCategory.id == category_id).first()
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return category
+
+def _create_category(db: Session, category: SkillCategoryCreate):
+    db_category = db.scalar(insert(SkillCategory).values(**category.model_dump()).returning(SkillCategory))
+    db.commit()
+    # A new category has no skills; don't spend a SELECT finding that out
+    set_committed_value(db_category, "skills", [])
+    # Serialize here: the nested skills must not lazy-load outside the session
+    return SkillCategorySchema.model_validate(db_category)
+
+def _update_category(db: Session, category_id: int, category: SkillCategoryUpdate):
+    update_data = category.model_dump(exclude_unset=True)
+    if not update_data:
+        # Serialize here, like below: skills must not lazy-load outside the session
+        return SkillCategorySchema.model_validate(_get_category_with_skills(db, category_id))
+    
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_category = db.scalar(update(SkillCategory).where(SkillCategory.id == category_id).values(**update_data).returning(SkillCategory))
+    if not db_category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    db.commit()
+    return SkillCategorySchema.model_validate(db_category)
+
+def _delete_category(db: Session, category_id: int):
+    # Core DELETE bypasses the ORM cascade, so clear the skills explicitly
+    db.execute(delete(Skill).where(Skill.category_id == category_id))
+    if db.scalar(delete(SkillCategory).where(SkillCategory.id == category_id).returning(SkillCategory.id)) is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    db.commit()
+
+def _list_skills(db: Session, page: PageParams):
+    keys = [(Skill.category_id, False), (Skill.order_index, False), (Skill.id, False)]
+    return keyset_paginate(db.query(Skill), Skill, keys, page, SkillSchema)
+
+def _get_skill(db: Session, skill_id: int):
+    skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    if not skill:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return skill
+
+def _create_skill(db: Session, skill: SkillCreate):
+    # Verify category exists
+    _get_category(db, skill.category_id)
+    
+    db_skill = db.scalar(insert(Skill).values(**skill.model_dump()).returning(Skill))
+    db.commit()
+    return db_skill
+
+def _update_skill(db: Session, skill_id: int, skill: SkillUpdate):
+    update_data = skill.model_dump(exclude_unset=True)
+    if not update_data:
+        return _get_skill(db, skill_id)
+    
+    # Verify category exists if updating category_id
+    if skill.category_id:
+        _get_category(db, skill.category_id)
+    
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_skill = db.scalar(update(Skill).where(Skill.id == skill_id).values(**update_data).returning(Skill))
+    if not db_skill:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    db.commit()
+    return db_skill
+
+def _delete_skill(db: Session, skill_id: int):
+    if db.scalar(delete(Skill).where(Skill.id == skill_id).returning(Skill.id)) is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    db.commit()
+
+def _unknown_categories(db: Session, rows):
+    """Map request indexes to an error for rows pointing at a missing category"""
+    wanted = {row["category_id"] for row in rows if row.get("category_id") is not None}
+    known = set(db.scalars(select(SkillCategory.id).where(SkillCategory.id.in_(wanted))))
+    return {
+        index: "Category not found" for index, row in enumerate(rows)
+        if row.get("category_id") is not None and row["category_id"] not in known
+    }
+
+def _create_skills(db: Session, rows):
+    return bulk_insert(db, Skill, SkillSchema, rows, rejected=_unknown_categories(db, rows))
+
+def _update_skills(db: Session, rows):
+    return bulk_update(db, Skill, SkillSchema, rows, "Skill not found", rejected=_unknown_categories(db, rows))
+
 # Skill Category Routes
 @router.get("/categories", response_model=List[SkillCategorySchema])
-def get_categories(db: Session = Depends(get_db)):
+@cached("skills", schema=List[SkillCategorySchema])
+async def get_categories(db: AnySession = Depends(get_read_db)):
     """Get all skill categories with their skills"""
-    from sqlalchemy.orm import joinedload
-    return db.query(SkillCategory).options(joinedload(SkillCategory.skills)).order_by(SkillCategory.order_index).all()
+    return await run_db(db, _list_categories)
+
+# Bulk Skill Category Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/categories/bulk", response_model=BulkResult[SkillCategorySchema])
+async def create_categories_bulk(categories: List[SkillCategoryCreate], db: AnySession = Depends(get_db)):
+    """Create many skill categories in one transaction, reporting failures per item"""
+    check_batch_size(categories)
+    result = await run_db(db, bulk_insert, SkillCategory, SkillCategorySchema, [category.model_dump() for category in categories], options=[selectinload(SkillCategory.skills)])
+    response_cache.invalidate("skills")
+    return result
+
+@router.patch("/categories/bulk", response_model=BulkResult[SkillCategorySchema])
+async def update_categories_bulk(categories: List[SkillCategoryBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many skill categories in one transaction, reporting failures per item"""
+    check_batch_size(categories)
+    result = await run_db(db, bulk_update, SkillCategory, SkillCategorySchema, [category.model_dump(exclude_unset=True) for category in categories], "Category not found", options=[selectinload(SkillCategory.skills)])
+    response_cache.invalidate("skills")
+    return result
+
+@router.delete("/categories/bulk", response_model=BulkDeleteResult)
+async def delete_categories_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many skill categories in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, SkillCategory, body.ids, "Category not found", children=[(Skill, Skill.category_id)])
+    response_cache.invalidate("skills")
+    return result
 
 @router.get("/categories/{category_id}", response_model=SkillCategorySchema)
-def get_category(category_id: int, db: Session = Depends(get_db)):
+@cached("skills", schema=SkillCategorySchema)
+async def get_category(category_id: int, db: AnySession = Depends(get_read_db)):
     """Get a specific category by ID"""
-    from sqlalchemy.orm import joinedload
-    category = db.query(SkillCategory).options(joinedload(SkillCategory.skills)).filter(SkillCategory.id == category_id).first()
-    if not category:
-        raise HTTPException(status_code=404, detail="Category not found")
-    return category
+    return await run_db(db, _get_category_with_skills, category_id)
 
 @router.post("/categories", response_model=SkillCategorySchema, status_code=201)
-def create_category(category: SkillCategoryCreate, db: Session = Depends(get_db)):
+async def create_category(category: SkillCategoryCreate, db: AnySession = Depends(get_db)):
     """Create a new skill category"""
-    db_category = SkillCategory(**category.model_dump())
-    db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
+    db_category = await run_db(db, _create_category, category)
+    response_cache.invalidate("skills")
     return db_category
 
 @router.put("/categories/{category_id}", response_model=SkillCategorySchema)
-def update_category(category_id: int, category: SkillCategoryUpdate, db: Session = Depends(get_db)):
+async def update_category(category_id: int, category: SkillCategoryUpdate, db: AnySession = Depends(get_db)):
     """Update a skill category"""
-    db_category = db.query(SkillCategory).filter(SkillCategory.id == category_id).first()
-    if not db_category:
-        raise HTTPException(status_code=404, detail="Category not found")
-    
-    update_data = category.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_category, field, value)
-    
-    db.commit()
-    db.refresh(db_category)
+    db_category = await run_db(db, _update_category, category_id, category)
+    response_cache.invalidate("skills")
     return db_category
 
 @router.delete("/categories/{category_id}", status_code=204)
-def delete_category(category_id: int, db: Session = Depends(get_db)):
+async def delete_category(category_id: int, db: AnySession = Depends(get_db)):
     """Delete a skill category (will cascade delete skills)"""
-    db_category = db.query(SkillCategory).filter(SkillCategory.id == category_id).first()
-    if not db_category:
-        raise HTTPException(status_code=404, detail="Category not found")
-    
-    db.delete(db_category)
-    db.commit()
+    await run_db(db, _delete_category, category_id)
+    response_cache.invalidate("skills")
     return None
 
 # Skill Routes
 @router.get("/", response_model=List[SkillSchema])
-def get_skills(db: Session = Depends(get_db)):
-    """Get all skills"""
-    return db.query(Skill).order_by(Skill.category_id, Skill.order_index).all()
+@cached("skills", schema=List[SkillSchema])
+async def get_skills(page: PageParams = Depends(page_params), db: AnySession = Depends(get_read_db)):
+    """Get skills ordered by category, one page at a time"""
+    return await run_db(db, _list_skills, page)
+
+# Bulk Skill Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/bulk", response_model=BulkResult[SkillSchema])
+async def create_skills_bulk(skills: List[SkillCreate], db: AnySession = Depends(get_db)):
+    """Create many skills in one transaction, reporting failures per item"""
+    check_batch_size(skills)
+    result = await run_db(db, _create_skills, [skill.model_dump() for skill in skills])
+    response_cache.invalidate("skills")
+    return result
+
+@router.patch("/bulk", response_model=BulkResult[SkillSchema])
+async def update_skills_bulk(skills: List[SkillBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many skills in one transaction, reporting failures per item"""
+    check_batch_size(skills)
+    result = await run_db(db, _update_skills, [skill.model_dump(exclude_unset=True) for skill in skills])
+    response_cache.invalidate("skills")
+    return result
+
+@router.delete("/bulk", response_model=BulkDeleteResult)
+async def delete_skills_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many skills in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, Skill, body.ids, "Skill not found")
+    response_cache.invalidate("skills")
+    return result
 
 @router.get("/{skill_id}", response_model=SkillSchema)
-def get_skill(skill_id: int, db: Session = Depends(get_db)):
+@cached("skills", schema=SkillSchema)
+async def get_skill(skill_id: int, db: AnySession = Depends(get_read_db)):
     """Get a specific skill by ID"""
-    skill = db.query(Skill).filter(Skill.id == skill_id).first()
-    if not skill:
-        raise HTTPException(status_code=404, detail="Skill not found")
-    return skill
+    return await run_db(db, _get_skill, skill_id)
 
 @router.post("/", response_model=SkillSchema, status_code=201)
-def create_skill(skill: SkillCreate, db: Session = Depends(get_db)):
+async def create_skill(skill: SkillCreate, db: AnySession = Depends(get_db)):
     """Create a new skill"""
-    # Verify category exists
-    category = db.query(SkillCategory).filter(SkillCategory.id == skill.category_id).first()
-    if not category:
-        raise HTTPException(status_code=404, detail="Category not found")
-    
-    db_skill = Skill(**skill.model_dump())
-    db.add(db_skill)
-    db.commit()
-    db.refresh(db_skill)
+    db_skill = await run_db(db, _create_skill, skill)
+    response_cache.invalidate("skills")
     return db_skill
 
 @router.put("/{skill_id}", response_model=SkillSchema)
-def update_skill(skill_id: int, skill: SkillUpdate, db: Session = Depends(get_db)):
+async def update_skill(skill_id: int, skill: SkillUpdate, db: AnySession = Depends(get_db)):
     """Update a skill"""
-    db_skill = db.query(Skill).filter(Skill.id == skill_id).first()
-    if not db_skill:
-        raise HTTPException(status_code=404, detail="Skill not found")
-    
-    # Verify category exists if updating category_id
-    if skill.category_id and skill.category_id != db_skill.category_id:
-        category = db.query(SkillCategory).filter(SkillCategory.id == skill.category_id).first()
-        if not category:
-            raise HTTPException(status_code=404, detail="Category not found")
-    
-    update_data = skill.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_skill, field, value)
-    
-    db.commit()
-    db.refresh(db_skill)
+    db_skill = await run_db(db, _update_skill, skill_id, skill)
+    response_cache.invalidate("skills")
     return db_skill
 
 @router.delete("/{skill_id}", status_code=204)
-def delete_skill(skill_id: int, db: Session = Depends(get_db)):
+async def delete_skill(skill_id: int, db: AnySession = Depends(get_db)):
     """Delete a skill"""
-    db_skill = db.query(Skill).filter(Skill.id == skill_id).first()
-    if not db_skill:
-        raise HTTPException(status_code=404, detail="Skill not found")
-    
-    db.delete(db_skill)
-    db.commit()
+    await run_db(db, _delete_skill, skill_id)
+    response_cache.invalidate("skills")
     return None
-
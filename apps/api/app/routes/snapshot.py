@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Query
+from starlette.concurrency import run_in_threadpool
+from app.core.database import SessionLocal
+from app.core.snapshot import snapshot_exporter
+from app.schemas.snapshot import SnapshotResult
+
+router = APIRouter(prefix="/snapshot", tags=["Snapshot"])
+
+def _export(force: bool):
+    # Always the primary: a lagging replica would export rows it hasn't replayed yet
+    db = SessionLocal()
+    try:
+        return snapshot_exporter.export(db, force=force)
+    finally:
+        db.close()
+
+@router.post("/", response_model=SnapshotResult)
+async def export_snapshot(force: bool = Query(False, description="Re-render every collection, changed or not")):
+    """Regenerate the static JSON snapshot for the collections that changed since the last export"""
+    # Rendering, compression and file writes stay off the event loop in both database modes
+    return await run_in_threadpool(_export, force)
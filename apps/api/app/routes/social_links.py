@@ -1,57 +1,102 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import Session
 from typing import List
-from app.core.database import get_db
+from app.core.database import AnySession, get_db, get_read_db, run_db
+from app.core.bulk import bulk_delete, bulk_insert, bulk_update, check_batch_size
+from app.core.cache import cached, response_cache
 from app.models.social_link import SocialLink
-from app.schemas.social_link import SocialLink as SocialLinkSchema, SocialLinkCreate, SocialLinkUpdate
+from app.schemas.social_link import SocialLink as SocialLinkSchema, SocialLinkCreate, SocialLinkUpdate, SocialLinkBulkUpdate
+from app.schemas.bulk import BulkDelete, BulkDeleteResult, BulkResult
 
 router = APIRouter(prefix="/social-links", tags=["Social Links"])
 
-@router.get("/", response_model=List[SocialLinkSchema])
-def get_social_links(db: Session = Depends(get_db)):
-    """Get all social links ordered by order_index"""
+# Synchronous ORM work, executed through run_db
+def _list_social_links(db: Session):
     return db.query(SocialLink).order_by(SocialLink.order_index).all()
 
-@router.get("/{link_id}", response_model=SocialLinkSchema)
-def get_social_link(link_id: int, db: Session = Depends(get_db)):
-    """Get a specific social link by ID"""
+def _get_social_link(db: Session, link_id: int):
     link = db.query(SocialLink).filter(SocialLink.id == link_id).first()
     if not link:
         raise HTTPException(status_code=404, detail="Social link not found")
     return link
 
-@router.post("/", response_model=SocialLinkSchema, status_code=201)
-def create_social_link(link: SocialLinkCreate, db: Session = Depends(get_db)):
-    """Create a new social link"""
-    db_link = SocialLink(**link.model_dump())
-    db.add(db_link)
+def _create_social_link(db: Session, link: SocialLinkCreate):
+    db_link = db.scalar(insert(SocialLink).values(**link.model_dump()).returning(SocialLink))
     db.commit()
-    db.refresh(db_link)
     return db_link
 
-@router.put("/{link_id}", response_model=SocialLinkSchema)
-def update_social_link(link_id: int, link: SocialLinkUpdate, db: Session = Depends(get_db)):
-    """Update an existing social link"""
-    db_link = db.query(SocialLink).filter(SocialLink.id == link_id).first()
-    if not db_link:
-        raise HTTPException(status_code=404, detail="Social link not found")
-    
+def _update_social_link(db: Session, link_id: int, link: SocialLinkUpdate):
     update_data = link.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_link, field, value)
+    if not update_data:
+        return _get_social_link(db, link_id)
     
+    # One UPDATE ... RETURNING instead of SELECT + UPDATE + SELECT
+    db_link = db.scalar(update(SocialLink).where(SocialLink.id == link_id).values(**update_data).returning(SocialLink))
+    if not db_link:
+        raise HTTPException(status_code=404, detail="Social link not found")
     db.commit()
-    db.refresh(db_link)
     return db_link
 
-@router.delete("/{link_id}", status_code=204)
-def delete_social_link(link_id: int, db: Session = Depends(get_db)):
-    """Delete a social link"""
-    db_link = db.query(SocialLink).filter(SocialLink.id == link_id).first()
-    if not db_link:
+def _delete_social_link(db: Session, link_id: int):
+    if db.scalar(delete(SocialLink).where(SocialLink.id == link_id).returning(SocialLink.id)) is None:
         raise HTTPException(status_code=404, detail="Social link not found")
-    
-    db.delete(db_link)
     db.commit()
-    return None
 
+@router.get("/", response_model=List[SocialLinkSchema])
+@cached("social_links", schema=List[SocialLinkSchema])
+async def get_social_links(db: AnySession = Depends(get_read_db)):
+    """Get all social links ordered by order_index"""
+    return await run_db(db, _list_social_links)
+
+# Bulk Social Link Routes (declared before the /{id} routes so "bulk" is not read as an id)
+@router.post("/bulk", response_model=BulkResult[SocialLinkSchema])
+async def create_social_links_bulk(links: List[SocialLinkCreate], db: AnySession = Depends(get_db)):
+    """Create many social links in one transaction, reporting failures per item"""
+    check_batch_size(links)
+    result = await run_db(db, bulk_insert, SocialLink, SocialLinkSchema, [link.model_dump() for link in links])
+    response_cache.invalidate("social_links")
+    return result
+
+@router.patch("/bulk", response_model=BulkResult[SocialLinkSchema])
+async def update_social_links_bulk(links: List[SocialLinkBulkUpdate], db: AnySession = Depends(get_db)):
+    """Update many social links in one transaction, reporting failures per item"""
+    check_batch_size(links)
+    result = await run_db(db, bulk_update, SocialLink, SocialLinkSchema, [link.model_dump(exclude_unset=True) for link in links], "Social link not found")
+    response_cache.invalidate("social_links")
+    return result
+
+@router.delete("/bulk", response_model=BulkDeleteResult)
+async def delete_social_links_bulk(body: BulkDelete, db: AnySession = Depends(get_db)):
+    """Delete many social links in one statement, reporting ids that were not found"""
+    check_batch_size(body.ids)
+    result = await run_db(db, bulk_delete, SocialLink, body.ids, "Social link not found")
+    response_cache.invalidate("social_links")
+    return result
+
+@router.get("/{link_id}", response_model=SocialLinkSchema)
+@cached("social_links", schema=SocialLinkSchema)
+async def get_social_link(link_id: int, db: AnySession = Depends(get_read_db)):
+    """Get a specific social link by ID"""
+    return await run_db(db, _get_social_link, link_id)
+
+@router.post("/", response_model=SocialLinkSchema, status_code=201)
+async def create_social_link(link: SocialLinkCreate, db: AnySession = Depends(get_db)):
+    """Create a new social link"""
+    db_link = await run_db(db, _create_social_link, link)
+    response_cache.invalidate("social_links")
+    return db_link
+
+@router.put("/{link_id}", response_model=SocialLinkSchema)
+async def update_social_link(link_id: int, link: SocialLinkUpdate, db: AnySession = Depends(get_db)):
+    """Update an existing social link"""
+    db_link = await run_db(db, _update_social_link, link_id, link)
+    response_cache.invalidate("social_links")
+    return db_link
+
+@router.delete("/{link_id}", status_code=204)
+async def delete_social_link(link_id: int, db: AnySession = Depends(get_db)):
+    """Delete a social link"""
+    await run_db(db, _delete_social_link, link_id)
+    response_cache.invalidate("social_links")
+    return None
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Literal, Optional
+from app.core.database import AnySession, get_read_db, run_db
+from app.core.cache import cached
+from app.core.tags import tag_counts
+from app.models.experience import Experience
+from app.models.project import Project
+from app.schemas.tag import TagCount
+
+router = APIRouter(prefix="/tags", tags=["Tags"])
+
+TAGGED_TYPES = {"project": Project, "experience": Experience}
+
+def _list_tags(db: Session, kind: Optional[str]):
+    models = [TAGGED_TYPES[kind]] if kind else list(TAGGED_TYPES.values())
+    return tag_counts(db, models)
+
+@router.get("/", response_model=List[TagCount])
+@cached("projects", "experiences", schema=List[TagCount])
+async def get_tags(
+    kind: Optional[Literal["project", "experience"]] = Query(None, alias="type", description="Count only projects or only experiences"),
+    db: AnySession = Depends(get_read_db),
+):
+    """Get every tag in use with how many items carry it, most used first"""
+    return await run_db(db, _list_tags, kind)
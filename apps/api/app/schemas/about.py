@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel
 from typing import Optional
 
@@ -14,10 +15,13 @@ class AboutUpdate(BaseModel):
     content: Optional[str] = None
     order_index: Optional[int] = None
 
+class AboutBulkUpdate(AboutUpdate):
+    id: int
+
 class About(AboutBase):
     id: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -36,10 +40,13 @@ class StatUpdate(BaseModel):
     label: Optional[str] = None
     order_index: Optional[int] = None
 
+class StatBulkUpdate(StatUpdate):
+    id: int
+
 class Stat(StatBase):
     id: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class BulkItemError(BaseModel):
+    index: int  # position of the item in the request body
+    id: Optional[int] = None
+    detail: str
+
+class BulkResult(BaseModel, Generic[T]):
+    items: List[T] = []
+    errors: List[BulkItemError] = []
+
+class BulkDelete(BaseModel):
+    ids: List[int]
+
+class BulkDeleteResult(BaseModel):
+    deleted: List[int] = []
+    errors: List[BulkItemError] = []
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 
@@ -12,11 +13,19 @@ class ContactCreate(ContactBase):
 class ContactUpdate(BaseModel):
     status: Optional[str] = None
 
+class ContactBulkUpdate(ContactUpdate):
+    id: int
+
+class ContactQueued(BaseModel):
+    """Returned with 202 when submissions are written by the ingestion queue"""
+    id: str  # submission id, not the database id (that's assigned when the batch is written)
+    status: str = "queued"
+
 class Contact(ContactBase):
     id: int
     status: Optional[str] = "new"
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, field_validator
 from typing import List, Optional
 
 class ExperienceBase(BaseModel):
@@ -9,7 +10,7 @@ class ExperienceBase(BaseModel):
     end_date: Optional[str] = None
     description: str
     tags: Optional[List[str]] = None
-    order_index: Optional[int] = 0
+    order_index: int = 0
 
 class ExperienceCreate(ExperienceBase):
     pass
@@ -24,10 +25,21 @@ class ExperienceUpdate(BaseModel):
     tags: Optional[List[str]] = None
     order_index: Optional[int] = None
 
+    @field_validator("order_index")
+    @classmethod
+    def not_null(cls, value):
+        # Leave it out to keep the current value; the column is NOT NULL
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class ExperienceBulkUpdate(ExperienceUpdate):
+    id: int
+
 class Experience(ExperienceBase):
     id: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List
+from app.schemas.project import Project
+from app.schemas.experience import Experience
+from app.schemas.skill import SkillCategory
+from app.schemas.about import About, Stat
+from app.schemas.social_link import SocialLink
+
+class Portfolio(BaseModel):
+    """Every public collection the frontend needs to render the page"""
+    projects: List[Project] = []
+    experiences: List[Experience] = []
+    skill_categories: List[SkillCategory] = []
+    about: List[About] = []
+    stats: List[Stat] = []
+    social_links: List[SocialLink] = []
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, field_serializer, field_validator
 from typing import List, Optional
 
 class ProjectBase(BaseModel):
@@ -8,8 +9,8 @@ class ProjectBase(BaseModel):
     tags: Optional[List[str]] = None
     live_url: Optional[str] = None
     github_url: Optional[str] = None
-    featured: Optional[str] = "false"
-    order_index: Optional[int] = 0
+    featured: bool = False  # also accepts the legacy "true"/"false" strings
+    order_index: int = 0
 
 class ProjectCreate(ProjectBase):
     pass
@@ -21,13 +22,29 @@ class ProjectUpdate(BaseModel):
     tags: Optional[List[str]] = None
     live_url: Optional[str] = None
     github_url: Optional[str] = None
-    featured: Optional[str] = None
+    featured: Optional[bool] = None
     order_index: Optional[int] = None
 
+    @field_validator("featured", "order_index")
+    @classmethod
+    def not_null(cls, value):
+        # Leave a field out to keep its current value; these columns are NOT NULL
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class ProjectBulkUpdate(ProjectUpdate):
+    id: int
+
 class Project(ProjectBase):
     id: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_serializer("featured")
+    def serialize_featured(self, featured: bool) -> str:
+        # Clients were built against the old String(10) column
+        return "true" if featured else "false"
 
     class Config:
         from_attributes = True
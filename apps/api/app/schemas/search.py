@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+class SearchResult(BaseModel):
+    type: str  # "project", "experience" or "skill"
+    id: int
+    title: str
+    rank: float  # higher is more relevant
+
+    class Config:
+        from_attributes = True
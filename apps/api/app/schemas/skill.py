@@ -1,10 +1,11 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, field_validator
 from typing import List, Optional
 
 class SkillBase(BaseModel):
     name: str
     category_id: int
-    order_index: Optional[int] = 0
+    order_index: int = 0
 
 class SkillCreate(SkillBase):
     pass
@@ -14,10 +15,21 @@ class SkillUpdate(BaseModel):
     category_id: Optional[int] = None
     order_index: Optional[int] = None
 
+    @field_validator("order_index")
+    @classmethod
+    def not_null(cls, value):
+        # Leave it out to keep the current value; the column is NOT NULL
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class SkillBulkUpdate(SkillUpdate):
+    id: int
+
 class Skill(SkillBase):
     id: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -34,11 +46,14 @@ class SkillCategoryUpdate(BaseModel):
     name: Optional[str] = None
     order_index: Optional[int] = None
 
+class SkillCategoryBulkUpdate(SkillCategoryUpdate):
+    id: int
+
 class SkillCategory(SkillCategoryBase):
     id: int
     skills: Optional[List[Skill]] = []
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
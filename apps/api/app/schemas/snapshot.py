@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import List
+
+class SnapshotResult(BaseModel):
+    rendered: List[str] = []  # collections whose rows changed since the last export
+    skipped: List[str] = []  # collections left as they were
+    written: int = 0  # files (each with its .gz and .br) written
+    unchanged: int = 0  # files rendered again but identical to the exported ones
+    removed: int = 0  # files of deleted items
+    files: int = 0  # files in the snapshot
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel
 from typing import Optional
 
@@ -16,10 +17,13 @@ class SocialLinkUpdate(BaseModel):
     icon_name: Optional[str] = None
     order_index: Optional[int] = None
 
+class SocialLinkBulkUpdate(SocialLinkUpdate):
+    id: int
+
 class SocialLink(SocialLinkBase):
     id: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
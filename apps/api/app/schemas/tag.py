@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+
+class TagCount(BaseModel):
+    name: str
+    count: int  # projects and/or experiences carrying the tag
@@ -0,0 +1,77 @@
+"""
+Production entry point: uvicorn with one worker process per core.
+
+Workers use uvloop and httptools, a tuned listen backlog and keep-alive,
+and drain in-flight requests on SIGTERM/SIGINT before exiting. The master
+process restarts workers that die (and, with SERVER_MAX_REQUESTS, recycles
+them). Defaults come from the SERVER_* settings; flags override them.
+
+Workers share no memory: each has its own response cache, kept in step with
+the others' writes through the database (RESPONSE_CACHE_SYNC_SECONDS, see
+app/core/cache_sync.py), and its own replica sticky window.
+
+Run with: python -m app.serve
+Migrate the schema first, once: python -m app.serve --migrate
+Development (single process, auto-reload): python -m app.serve --reload --migrate
+"""
+
+import argparse
+import os
+import uvicorn
+from app.core.config import settings
+
+def available_cores() -> int:
+    # Respects CPU affinity (taskset, cpusets) where the platform exposes it
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def worker_count(requested: int) -> int:
+    return requested if requested > 0 else available_cores()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="worker processes (0: one per core)")
+    parser.add_argument("--reload", action="store_true", help="development: one process restarted on code changes")
+    parser.add_argument("--migrate", action="store_true", help="run scripts/migrate.py once before starting the workers")
+    args = parser.parse_args()
+
+    workers = 1 if args.reload else worker_count(args.workers)
+    # Each worker has its own pool, so the database sees workers times as many
+    # connections; so does each read replica
+    connections = workers * (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    replicas = len(settings.replica_urls)
+    if args.migrate:
+        # Here in the master, so the workers never race on DDL
+        from scripts import migrate
+        migrate.main()
+    if workers > 1 and settings.RESPONSE_CACHE_ENABLED and settings.RESPONSE_CACHE_SYNC_SECONDS <= 0:
+        print(f"⚠️  RESPONSE_CACHE_SYNC_SECONDS is 0: a write leaves the other workers' caches stale for up to {settings.RESPONSE_CACHE_TTL_SECONDS}s")
+    print(f"🚀 Starting {workers} worker(s) on {args.host}:{args.port}, up to {connections} database connections"
+          + (f" each on the primary and {replicas} replica(s)" if replicas else ""))
+
+    uvicorn.run(
+        # An import string: each worker process imports the app itself
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        reload=args.reload,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS,
+        access_log=settings.SERVER_ACCESS_LOG,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        # Skip the per-response Server header
+        server_header=False,
+    )
+
+if __name__ == "__main__":
+    main()
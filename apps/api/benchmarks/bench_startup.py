@@ -0,0 +1,145 @@
+"""
+Cold start benchmark: how long a fresh worker takes to become useful.
+
+Measures, each in a new Python process and reporting the median of
+``--runs``:
+
+- import: ``import app.main`` (no database I/O happens at import)
+- ready: from launching ``python -m app.serve --workers 1`` to the first
+  200 from ``/health``, which includes the lifespan startup
+- shutdown: from SIGTERM to the process exiting
+
+and prints where import time goes (``python -X importtime``): by package
+(the standard library counted as one), and the slowest modules of the app
+itself.
+
+The database is a scratch SQLite file migrated once with scripts/migrate.py,
+or ``--url``; with a remote database the import time no longer depends on
+its latency.
+
+Run with: python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+API_DIR = Path(__file__).parent.parent
+
+import httpx
+
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import app.main; print(time.perf_counter() - start)"
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def run_python(env, *args) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=API_DIR, env=env, capture_output=True, text=True, check=True)
+
+def import_time(env) -> float:
+    return float(run_python(env, "-c", IMPORT_SNIPPET).stdout.strip().splitlines()[-1])
+
+def ready_and_shutdown(env, timeout: float = 30.0):
+    """Seconds from spawning the server to its first 200, and from SIGTERM to exit"""
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.serve", "--workers", "1", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=API_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                if process.poll() is not None or time.perf_counter() - start > timeout:
+                    raise RuntimeError("app.serve did not start")
+                time.sleep(0.005)
+        ready = time.perf_counter() - start
+        stopping = time.perf_counter()
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout)
+        return ready, time.perf_counter() - stopping
+    finally:
+        if process.poll() is None:
+            process.kill()
+
+def import_profile(env):
+    """(self microseconds by top-level package, self microseconds by app module)"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=API_DIR, env=env, capture_output=True, text=True, check=True,
+    ).stderr
+    packages, app_modules = defaultdict(int), {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        module = name.strip()
+        package = module.split(".")[0]
+        # Self times, so nested imports are never counted twice
+        if package == "app":
+            app_modules[module] = int(self_us)
+        packages["stdlib" if package in sys.stdlib_module_names else package] += int(self_us)
+    return dict(packages), app_modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="processes started per measurement (default: 5)")
+    parser.add_argument("--url", help="database URL (default: a temporary SQLite file)")
+    parser.add_argument("--top", type=int, default=8, help="rows shown in the import breakdowns (default: 8)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        scratch = tempfile.mkdtemp(prefix="bench-startup-")
+        url = f"sqlite:///{os.path.join(scratch, 'bench.db')}"
+    env = {**os.environ, "DATABASE_URL": url, "SERVER_ACCESS_LOG": "false"}
+    run_python(env, "-m", "scripts.migrate")
+
+    print(f"🚀 Starting the app {args.runs} times...")
+    # One untimed start so every run sees warm .pyc files and OS caches
+    import_time(env)
+    imports = [import_time(env) for _ in range(args.runs)]
+    lifecycle = [ready_and_shutdown(env) for _ in range(args.runs)]
+    packages, app_modules = import_profile(env)
+
+    results = {
+        "import_ms": round(statistics.median(imports) * 1000, 1),
+        "ready_ms": round(statistics.median(ready for ready, _ in lifecycle) * 1000, 1),
+        "shutdown_ms": round(statistics.median(shutdown for _, shutdown in lifecycle) * 1000, 1),
+        "import_by_package_ms": {name: round(us / 1000, 1) for name, us in sorted(packages.items(), key=lambda item: -item[1])},
+        "app_modules_self_ms": {name: round(us / 1000, 1) for name, us in sorted(app_modules.items(), key=lambda item: -item[1])},
+    }
+
+    print(f"{'import app.main':<24}{results['import_ms']:>10} ms")
+    print(f"{'spawn to first 200':<24}{results['ready_ms']:>10} ms")
+    print(f"{'SIGTERM to exit':<24}{results['shutdown_ms']:>10} ms")
+    print("Import time by package (self time of its modules):")
+    for name, ms in list(results["import_by_package_ms"].items())[:args.top]:
+        print(f"  {name:<22}{ms:>10} ms")
+    print("Slowest app modules (self):")
+    for name, ms in list(results["app_modules_self_ms"].items())[:args.top]:
+        print(f"  {name:<22}{ms:>10} ms")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"runs": args.runs, **results}, indent=2))
+        print(f"✓ Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
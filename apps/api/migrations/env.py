@@ -0,0 +1,81 @@
+import warnings
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import create_engine, pool
+from app.core.config import settings
+from app.core.database import Base
+from app.models.search import create_fts_index
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from scripts.migrate_indexes import for_dialect
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# SQLite's FTS5 search table and its shadow tables are managed by
+# app/models/search.py, not by the models
+FTS_TABLES = ("search_index",)
+
+# SQLite can't reflect expression indexes; the only ones are the Postgres GIN
+# search indexes, which include_object leaves out there anyway
+warnings.filterwarnings("ignore", message="autogenerate skipping metadata-specified expression-based index")
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate away from objects that don't belong to this database"""
+    if type_ == "table" and name is not None and name.startswith(FTS_TABLES):
+        return False
+    if type_ == "index" and not reflected and not for_dialect(object, context.get_context().dialect.name):
+        return False  # e.g. the Postgres-only GIN search indexes, on SQLite
+    return True
+
+def configure(**kwargs):
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        compare_type=True,
+        # SQLite can't ALTER most things in place; batch mode copies the table
+        render_as_batch=True,
+        # One transaction per revision, so a revision can step outside it
+        # (online.autocommit / CREATE INDEX CONCURRENTLY) without affecting the others
+        transaction_per_migration=True,
+        **kwargs,
+    )
+
+def run_migrations_offline():
+    """Emit the SQL instead of running it: alembic upgrade head --sql"""
+    configure(url=settings.DATABASE_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations(connection):
+    if connection.dialect.name == "postgresql":
+        # Session-level, so it also covers statements run in autocommit blocks
+        connection.exec_driver_sql(f"SET lock_timeout = {settings.MIGRATION_LOCK_TIMEOUT_MS}")
+        connection.commit()
+    configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+    if connection.dialect.name == "sqlite" and connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+    ).first():
+        # Batch mode rebuilds a table to alter it, dropping its search triggers
+        create_fts_index(connection)
+        connection.commit()
+
+def run_migrations_online():
+    # scripts/migrate.py passes the connection holding its advisory lock
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+    engine = create_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        run_migrations(connection)
+    engine.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
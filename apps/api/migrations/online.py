@@ -0,0 +1,95 @@
+"""
+Lock-safe building blocks for revisions that touch large or busy tables.
+
+Plain ``op.create_index`` / ``op.alter_column`` take locks that block writes
+(or reads) on Postgres for as long as the statement runs. These helpers do
+the same changes without long locks on Postgres, and fall back to the plain
+operation on SQLite, where the API runs single-node in development.
+See migrations/README.md for when to use which.
+"""
+
+import time
+from typing import Dict, Optional, Sequence
+from alembic import op
+from sqlalchemy import text
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+def _quote(name: str) -> str:
+    return op.get_context().dialect.identifier_preparer.quote(name)
+
+def create_index_concurrently(index_name: str, table_name: str, columns: Sequence, **kwargs):
+    """CREATE INDEX CONCURRENTLY: the table stays writable while the index builds.
+
+    CONCURRENTLY can't run inside a transaction, so this commits the
+    revision's work so far. An earlier attempt that failed halfway leaves an
+    INVALID index behind; it is dropped and rebuilt.
+    """
+    if not _is_postgres():
+        op.create_index(index_name, table_name, columns, **kwargs)
+        return
+    with op.get_context().autocommit_block():
+        invalid = op.get_bind().execute(
+            text("SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+                 "WHERE pg_class.relname = :name AND NOT pg_index.indisvalid"),
+            {"name": index_name},
+        ).first()
+        if invalid:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+        op.create_index(index_name, table_name, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+
+def drop_index_concurrently(index_name: str, table_name: str):
+    """DROP INDEX CONCURRENTLY: doesn't block queries on the table while dropping"""
+    if not _is_postgres():
+        op.drop_index(index_name, table_name=table_name)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+
+def backfill(table_name: str, values: Dict[str, str], where: Optional[str] = None,
+             batch_size: int = 1000, pause: float = 0.0) -> int:
+    """UPDATE ``table_name`` SET ``values`` (column -> SQL expression) in id-range batches.
+
+    Each batch commits on its own, so row locks are held for one batch
+    rather than the whole table and replicas don't fall behind on one huge
+    transaction. ``where`` (SQL) narrows the rows, e.g. ``"new_col IS NULL"``
+    so the backfill can be resumed; ``pause`` seconds between batches leave
+    room for regular traffic. Returns the number of rows updated.
+    """
+    table = _quote(table_name)
+    assignments = ", ".join(f"{_quote(column)} = {expression}" for column, expression in values.items())
+    condition = f" AND ({where})" if where else ""
+    statement = text(f"UPDATE {table} SET {assignments} WHERE id > :low AND id <= :high{condition}")
+    updated = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        low, high = bind.execute(text(f"SELECT min(id) - 1, max(id) FROM {table}")).first()
+        if high is None:
+            return 0
+        while low < high:
+            updated += bind.execute(statement, {"low": low, "high": low + batch_size}).rowcount
+            low += batch_size
+            if pause:
+                time.sleep(pause)
+    return updated
+
+def set_not_null(table_name: str, column_name: str):
+    """ALTER COLUMN ... SET NOT NULL without scanning the table under an exclusive lock.
+
+    Adds a NOT VALID check (instant), validates it (SHARE UPDATE EXCLUSIVE,
+    so reads and writes continue), after which Postgres 12+ sets NOT NULL
+    without another scan. Backfill the column first.
+    """
+    if not _is_postgres():
+        with op.batch_alter_table(table_name) as batch:
+            batch.alter_column(column_name, nullable=False)
+        return
+    table, column = _quote(table_name), _quote(column_name)
+    check = _quote(f"{table_name}_{column_name}_not_null")
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        bind.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {check} CHECK ({column} IS NOT NULL) NOT VALID"))
+        bind.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {check}"))
+        bind.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL"))
+        bind.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {check}"))
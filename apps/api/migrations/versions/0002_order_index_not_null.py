@@ -0,0 +1,44 @@
+"""order_index not null on keyset-paginated tables
+
+Keyset pagination compares (order_index, id) row values; a NULL order_index
+made the comparison NULL and ended paging early. Existing NULLs become 0,
+the value the API always defaulted to.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 22:30:12.504117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+# Lock-safe building blocks for Postgres; see migrations/README.md
+from migrations import online  # noqa: F401
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("projects", "experiences", "skills")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        # New rows written by the previous release get 0 from here on
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('order_index', existing_type=sa.Integer(), server_default=sa.text('0'))
+    for table in TABLES:
+        online.backfill(table, {"order_index": "0"}, where="order_index IS NULL")
+        online.set_not_null(table, "order_index")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('order_index', existing_type=sa.Integer(), nullable=True, server_default=None)
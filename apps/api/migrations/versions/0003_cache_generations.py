@@ -0,0 +1,34 @@
+"""cache_generations table for cross-worker cache invalidation
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 22:41:05.218374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+# Lock-safe building blocks for Postgres; see migrations/README.md
+from migrations import online  # noqa: F401
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_generations',
+    sa.Column('tag', sa.String(length=100), nullable=False),
+    sa.Column('generation', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('tag')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_generations')
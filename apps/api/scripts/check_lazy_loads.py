@@ -0,0 +1,98 @@
+"""
+N+1 check: request every GET route once and report the relationships each
+one lazy-loads. A route that lazy-loads the same relationship more than
+``--threshold`` times (default LAZY_LOAD_THRESHOLD) is listed as a failure
+and the script exits with status 1, so it can gate CI.
+
+Runs in-process against the configured DATABASE_URL with the response
+cache off; seed it first so the lists have enough rows to show N+1 patterns.
+
+Run with: python -m scripts.check_lazy_loads
+Or: python scripts/check_lazy_loads.py --threshold 0
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Every request must reach the ORM, and this script does its own tracking
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["LAZY_LOAD_GUARD"] = "off"
+
+import httpx
+from fastapi.routing import APIRoute
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.lazyload import LazyLoadGuard
+from app.main import app
+from app.models import About, Contact, Experience, Project, Skill, SkillCategory, SocialLink, Stat
+
+# Path parameter -> model whose first row fills it
+PATH_IDS = {
+    "project_id": Project, "experience_id": Experience, "contact_id": Contact,
+    "category_id": SkillCategory, "skill_id": Skill, "about_id": About,
+    "stat_id": Stat, "link_id": SocialLink,
+}
+
+def read_paths():
+    """route template -> concrete path for every GET route whose ids exist"""
+    db = SessionLocal()
+    try:
+        ids = {name: db.scalar(select(func.min(model.id))) for name, model in PATH_IDS.items()}
+    finally:
+        db.close()
+
+    paths = {}
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        path = route.path
+        for name in route.param_convertors:
+            if ids.get(name) is None:
+                break
+            path = path.replace("{%s}" % name, str(ids[name]))
+        else:
+            paths[route.path] = path + ("?q=python" if route.path == "/search/" else "")
+    return paths
+
+async def check(guard: LazyLoadGuard):
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+        for template, path in read_paths().items():
+            # Tracked around the in-process call: the app runs in this task
+            with guard.track(f"GET {template}") as loads:
+                response = await client.get(path)
+            results[template] = (response.status_code, dict(loads))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=int, default=settings.LAZY_LOAD_THRESHOLD,
+                        help="lazy loads of one relationship allowed per request")
+    args = parser.parse_args()
+
+    print("🔍 Checking GET routes for N+1 lazy loads...")
+    print("-" * 50)
+    guard = LazyLoadGuard(args.threshold, action="record")
+    results = asyncio.run(check(guard))
+    for template, (status, loads) in results.items():
+        label = f"GET {template}"
+        details = ", ".join(f"{relationship} x{count}" for relationship, count in loads.items()) or "no lazy loads"
+        mark = "❌" if label in guard.violations else "✓"
+        print(f"{mark} {label} [{status}]: {details}")
+
+    print("-" * 50)
+    if guard.violations:
+        print(f"❌ {len(guard.violations)} route(s) lazy-load a relationship more than {args.threshold} time(s)")
+        sys.exit(1)
+    print(f"✅ {len(results)} routes checked, none over the threshold of {args.threshold}")
+
+if __name__ == "__main__":
+    main()
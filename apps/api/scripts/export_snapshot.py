@@ -0,0 +1,53 @@
+"""
+Export the public API to static JSON files (see app/core/snapshot.py), each
+with .gz and .br siblings, plus a manifest.json of hashes. Only collections
+whose rows changed since the last export are rendered again.
+
+The API does the same on POST /snapshot/.
+
+Run with: python -m scripts.export_snapshot [--out ./snapshot] [--force]
+Or: python scripts/export_snapshot.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.snapshot import SnapshotExporter
+
+def main():
+    """Bring the static snapshot up to date"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=settings.SNAPSHOT_DIR, help=f"output directory (default: {settings.SNAPSHOT_DIR})")
+    parser.add_argument("--force", action="store_true", help="re-render every collection, changed or not")
+    args = parser.parse_args()
+
+    print(f"📦 Exporting snapshot to {args.out}...")
+    print("-" * 50)
+
+    db = SessionLocal()
+    try:
+        summary = SnapshotExporter(args.out).export(db, force=args.force)
+    except Exception as e:
+        print(f"❌ Error exporting snapshot: {e}")
+        raise
+    finally:
+        db.close()
+
+    for name in summary["rendered"]:
+        print(f"✓ Rendered {name}")
+    for name in summary["skipped"]:
+        print(f"✓ Skipped {name} (unchanged)")
+    print("-" * 50)
+    print(
+        f"✅ {summary['files']} files: {summary['written']} written, "
+        f"{summary['unchanged']} unchanged, {summary['removed']} removed"
+    )
+
+if __name__ == "__main__":
+    main()
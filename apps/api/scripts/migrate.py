@@ -0,0 +1,97 @@
+"""
+Bring the database schema up to date: alembic upgrade head (see
+migrations/README.md).
+
+The API doesn't touch the schema itself, so run this once per deploy, before
+the workers start, rather than letting every worker race on the same DDL.
+`python -m app.serve --migrate` runs it in the server's master process.
+
+Databases created before the move to Alembic (tables, but no alembic_version)
+are first brought to the initial revision: missing tables (create_all()) and
+indexes (migrate_indexes.py), legacy string columns converted
+(migrate_typed_columns.py) and the tag index filled (rebuild_tags.py). Only
+then are they stamped with it.
+
+Run with: python -m scripts.migrate
+Or: python scripts/migrate.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+from app.core.database import engine, Base
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from scripts import migrate_indexes, migrate_typed_columns, rebuild_tags
+
+ALEMBIC_INI = Path(__file__).parent.parent / "alembic.ini"
+
+# The revision matching the schema create_all() used to build
+BASELINE_REVISION = "0001"
+
+# Arbitrary key for pg_advisory_lock; serializes migrations started by several containers
+MIGRATION_LOCK_ID = 0x706F7274
+
+def alembic_config(connection=None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+def adopt_legacy_schema(connection, config: Config) -> bool:
+    """Stamp a pre-Alembic database at the baseline; False when there is none"""
+    tables = set(inspect(connection).get_table_names())
+    if "alembic_version" in tables or not tables & set(Base.metadata.tables):
+        return False
+    Base.metadata.create_all(bind=connection)
+    connection.commit()
+    migrate_indexes.main()
+    migrate_typed_columns.migrate()
+    # Tag tables created just now are empty; older ones may be stale
+    rebuild_tags.main()
+    remaining = migrate_typed_columns.pending_columns(connection)
+    connection.commit()
+    if remaining:
+        names = ", ".join(f"{model_table.name}.{name}" for model_table, name, _, _ in remaining)
+        raise RuntimeError(f"Not stamping revision {BASELINE_REVISION}: {names} still stored as strings")
+    command.stamp(config, BASELINE_REVISION)
+    connection.commit()
+    return True
+
+def main():
+    """Upgrade the database to the latest revision"""
+    print("🔧 Migrating database schema...")
+    print("-" * 50)
+
+    with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql(f"SELECT pg_advisory_lock({MIGRATION_LOCK_ID})")
+            connection.commit()
+        try:
+            config = alembic_config(connection)
+            if adopt_legacy_schema(connection, config):
+                print(f"✓ Existing schema stamped at revision {BASELINE_REVISION}")
+            before = MigrationContext.configure(connection).get_current_revision()
+            # Alembic only manages (and can step out of) transactions it began itself
+            connection.commit()
+            command.upgrade(config, "head")
+            connection.commit()
+            after = MigrationContext.configure(connection).get_current_revision()
+            print(f"✓ Upgraded {before or 'empty database'} -> {after}" if after != before else f"✓ Already at {after}")
+        finally:
+            if connection.dialect.name == "postgresql":
+                connection.exec_driver_sql(f"SELECT pg_advisory_unlock({MIGRATION_LOCK_ID})")
+                connection.commit()
+
+    print("-" * 50)
+    print("✅ Schema up to date")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Create any index declared on the models that an existing database lacks.
+Base.metadata.create_all() only creates missing tables, so databases created
+before an index was added to a model need this script.
+
+On PostgreSQL indexes are built with CREATE INDEX CONCURRENTLY, so the tables
+stay writable while they build. A concurrent build that failed halfway leaves
+an INVALID index behind; it is dropped and rebuilt.
+
+Run with: python -m scripts.migrate_indexes
+Or: python scripts/migrate_indexes.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.schema import CreateIndex, DropIndex
+from app.core.database import engine, Base
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+def for_dialect(index, name: str) -> bool:
+    """False for indexes whose info["dialect"] names another backend (see app/models/search.py)"""
+    return index.info.get("dialect", name) == name
+
+def invalid_indexes(connection) -> set:
+    """Names of indexes left INVALID by a failed CREATE INDEX CONCURRENTLY"""
+    if connection.dialect.name != "postgresql":
+        return set()
+    return set(connection.execute(text(
+        "SELECT pg_class.relname FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+        "WHERE NOT pg_index.indisvalid"
+    )).scalars())
+
+def missing_indexes(connection, invalid: set = frozenset()):
+    """Indexes declared on the models but absent from the database, or among ``invalid``"""
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue  # create_all will build it with its indexes
+        existing = {index["name"] for index in inspector.get_indexes(table.name)} - invalid
+        missing.extend(
+            index for index in table.indexes
+            if index.name not in existing and for_dialect(index, connection.dialect.name)
+        )
+    return missing
+
+def concurrent_copy(index):
+    """``index`` with postgresql_concurrently set, on a scratch copy of its table.
+
+    The models' metadata is shared with the app and Alembic autogenerate, so
+    the option must not be set on it.
+    """
+    table = index.table.to_metadata(MetaData())
+    copy = next(candidate for candidate in table.indexes if candidate.name == index.name)
+    copy.dialect_kwargs["postgresql_concurrently"] = True
+    return copy
+
+def main():
+    """Create missing indexes without locking writers"""
+    print("🔧 Checking indexes...")
+    print("-" * 50)
+
+    concurrently = engine.dialect.name == "postgresql"
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        invalid = invalid_indexes(connection)
+        indexes = missing_indexes(connection, invalid)
+        for index in indexes:
+            if concurrently:
+                index = concurrent_copy(index)
+            if index.name in invalid:
+                connection.execute(DropIndex(index, if_exists=True))
+                print(f"✓ Dropped invalid {index.name} on {index.table.name}")
+            connection.execute(CreateIndex(index, if_not_exists=True))
+            print(f"✓ Created {index.name} on {index.table.name}")
+
+    print("-" * 50)
+    print(f"✅ {len(indexes)} index(es) created" if indexes else "✅ All indexes already exist")
+
+if __name__ == "__main__":
+    main()
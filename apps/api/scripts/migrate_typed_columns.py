@@ -0,0 +1,260 @@
+"""
+Online migration of the legacy string columns to native types:
+
+  - created_at / updated_at on every table: String(50) -> DateTime(timezone=True)
+  - projects.featured:                      String(10) -> Boolean
+
+Each column is migrated expand/backfill/swap style so the table stays
+readable and writable the whole time:
+
+  1. add a nullable shadow column with the new type (no rewrite, no long lock),
+     and a trigger resetting it to NULL whenever the app changes the old column
+  2. backfill it in small primary-key batches, one short transaction each
+  3. in one short transaction, with writes locked out: catch up rows whose
+     shadow is NULL (inserted, or changed since they were copied), drop the
+     trigger and the old column and rename the shadow column into place
+
+Naive timestamps are assumed to be UTC. Unparseable or missing timestamps
+become the migration time, missing flags become false. Indexes on migrated
+columns are recreated afterwards (concurrently on PostgreSQL).
+
+Run with: python -m scripts.migrate_typed_columns [--batch-size 1000]
+Or: python scripts/migrate_typed_columns.py
+"""
+
+import argparse
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import Boolean, DateTime, String, bindparam, column, inspect, select, table, text, update
+from app.core.config import settings
+from app.core.database import engine, Base
+from app.models.search import create_fts_index
+from scripts import migrate_indexes
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+SHADOW_SUFFIX = "__typed"
+TRUE_VALUES = {"true", "1", "yes", "on", "t", "y"}
+
+def to_datetime(value, fallback):
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip())
+        except (TypeError, ValueError):
+            return fallback
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def to_bool(value, fallback):
+    if value is None:
+        return fallback
+    return str(value).strip().lower() in TRUE_VALUES
+
+def pending_columns(connection):
+    """(table, column, new type, converter) for every column still stored as a string"""
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    pending = []
+    for model_table in Base.metadata.sorted_tables:
+        if model_table.name not in existing_tables:
+            continue
+        current = {col["name"]: col["type"] for col in inspector.get_columns(model_table.name)}
+        for name in ("created_at", "updated_at", "featured"):
+            if name not in model_table.c or not isinstance(current.get(name), String):
+                continue
+            target = model_table.c[name].type
+            converter = to_bool if isinstance(target, Boolean) else to_datetime
+            pending.append((model_table, name, target, converter))
+    return pending
+
+def indexes_on(model_table, name):
+    """Indexes that cover the column or mention it in a partial-index predicate"""
+    mentions = re.compile(rf"\b{re.escape(name)}\b")
+    return [
+        index for index in model_table.indexes
+        if name in index.columns or any(
+            key.endswith("_where") and value is not None and mentions.search(str(value))
+            for key, value in index.dialect_kwargs.items()
+        )
+    ]
+
+def _same(converted, current):
+    if isinstance(converted, datetime) and isinstance(current, datetime):
+        # SQLite hands timestamps back naive; both are UTC
+        return converted == (current if current.tzinfo else current.replace(tzinfo=timezone.utc))
+    return converted == current
+
+def backfill(connection, model_table, name, shadow, target, converter, batch_size, only_missing=False):
+    """Copy converted values into the shadow column in primary-key order.
+
+    Rows whose shadow already holds the converted value are skipped, so a
+    resumed run rewrites only what changed while it wasn't running. Each
+    UPDATE only applies if the old column still holds the value it was
+    converted from; a row the app changed in between keeps its NULL shadow
+    (see create_sync_trigger) for the catch-up.
+    """
+    source = table(model_table.name, column("id"), column(name), column(shadow, target))
+    fallback = False if isinstance(target, Boolean) else datetime.now(timezone.utc)
+    statement = (
+        update(source)
+        .where(source.c.id == bindparam("row_id"), source.c[name].is_not_distinct_from(bindparam("old")))
+        .values({shadow: bindparam("value", type_=target)})
+    )
+    last_id, copied = 0, 0
+    while True:
+        query = select(source.c.id, source.c[name], source.c[shadow]).where(source.c.id > last_id)
+        if only_missing:
+            query = query.where(source.c[shadow].is_(None))
+        rows = connection.execute(query.order_by(source.c.id).limit(batch_size)).fetchall()
+        if not rows:
+            return copied
+        changes = [
+            {"row_id": row_id, "old": value, "value": converted}
+            for row_id, value, current in rows
+            for converted in [converter(value, fallback)]
+            if not _same(converted, current)
+        ]
+        if changes:
+            connection.execute(statement, changes)
+        if connection.in_transaction() and not only_missing:
+            connection.commit()  # keep each batch's locks short
+        last_id, copied = rows[-1][0], copied + len(changes)
+
+def _sync_trigger(model_table, name):
+    return f"{model_table.name}_{name}{SHADOW_SUFFIX}_sync"
+
+def create_sync_trigger(connection, model_table, name, shadow):
+    """While the migration runs, a write to the old column resets the shadow to NULL"""
+    trigger = _sync_trigger(model_table, name)
+    quoted_table = connection.dialect.identifier_preparer.quote(model_table.name)
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(
+            f"CREATE OR REPLACE FUNCTION {trigger}() RETURNS trigger LANGUAGE plpgsql "
+            f"AS $$ BEGIN NEW.{shadow} := NULL; RETURN NEW; END $$"
+        )
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger} ON {quoted_table}")
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER {trigger} BEFORE UPDATE OF {name} ON {quoted_table} FOR EACH ROW "
+            f"WHEN (NEW.{name} IS DISTINCT FROM OLD.{name}) EXECUTE FUNCTION {trigger}()"
+        )
+    else:
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {trigger} AFTER UPDATE OF {name} ON {quoted_table} "
+            f"FOR EACH ROW WHEN NEW.{name} IS NOT OLD.{name} "
+            f"BEGIN UPDATE {quoted_table} SET {shadow} = NULL WHERE id = NEW.id; END"
+        )
+
+def drop_sync_trigger(connection, model_table, name):
+    trigger = _sync_trigger(model_table, name)
+    quoted_table = connection.dialect.identifier_preparer.quote(model_table.name)
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger} ON {quoted_table}")
+        connection.exec_driver_sql(f"DROP FUNCTION IF EXISTS {trigger}()")
+    else:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+
+def migrate_column(model_table, name, target, converter, batch_size):
+    dialect = engine.dialect
+    shadow = f"{name}{SHADOW_SUFFIX}"
+    quoted_table = dialect.identifier_preparer.quote(model_table.name)
+    type_sql = target.compile(dialect=dialect)
+
+    with engine.connect() as connection:
+        existing = {col["name"] for col in inspect(connection).get_columns(model_table.name)}
+        if shadow not in existing:
+            connection.execute(text(f"ALTER TABLE {quoted_table} ADD COLUMN {shadow} {type_sql}"))
+        create_sync_trigger(connection, model_table, name, shadow)
+        connection.commit()
+        copied = backfill(connection, model_table, name, shadow, target, converter, batch_size)
+        connection.commit()
+
+    with engine.begin() as connection:
+        if dialect.name == "postgresql":
+            # No write may land between the catch-up and the swap. DROP COLUMN
+            # takes this lock anyway; give up rather than queue behind a long query.
+            connection.execute(text(f"SET LOCAL lock_timeout = {settings.MIGRATION_LOCK_TIMEOUT_MS}"))
+            connection.execute(text(f"LOCK TABLE {quoted_table} IN ACCESS EXCLUSIVE MODE"))
+        # Rows inserted, or changed by the running app, since they were backfilled
+        caught_up = backfill(connection, model_table, name, shadow, target, converter, batch_size, only_missing=True)
+        drop_sync_trigger(connection, model_table, name)
+        # SQLite refuses to drop an indexed column; indexes are recreated below
+        for index in indexes_on(model_table, name):
+            connection.execute(text(f"DROP INDEX IF EXISTS {dialect.identifier_preparer.quote(index.name)}"))
+        connection.execute(text(f"ALTER TABLE {quoted_table} DROP COLUMN {name}"))
+        connection.execute(text(f"ALTER TABLE {quoted_table} RENAME COLUMN {shadow} TO {name}"))
+
+    if dialect.name == "postgresql":
+        enforce_not_null(model_table, name)
+    print(f"✓ {model_table.name}.{name}: {copied} rows backfilled, {caught_up} caught up")
+
+def enforce_not_null(model_table, name):
+    """Add the DEFAULT and NOT NULL the model declares without a long ACCESS EXCLUSIVE lock"""
+    column_obj = model_table.c[name]
+    quoted_table = engine.dialect.identifier_preparer.quote(model_table.name)
+    check = f"{model_table.name}_{name}_not_null"
+    default = "now()" if isinstance(column_obj.type, DateTime) else "false"
+    with engine.begin() as connection:
+        connection.execute(text(f"ALTER TABLE {quoted_table} ALTER COLUMN {name} SET DEFAULT {default}"))
+        # NOT VALID is instant; VALIDATE only takes a SHARE UPDATE EXCLUSIVE lock
+        connection.execute(text(f"ALTER TABLE {quoted_table} ADD CONSTRAINT {check} CHECK ({name} IS NOT NULL) NOT VALID"))
+    with engine.begin() as connection:
+        connection.execute(text(f"ALTER TABLE {quoted_table} VALIDATE CONSTRAINT {check}"))
+    with engine.begin() as connection:
+        # Postgres 12+ skips the table scan thanks to the validated check
+        connection.execute(text(f"ALTER TABLE {quoted_table} ALTER COLUMN {name} SET NOT NULL"))
+        connection.execute(text(f"ALTER TABLE {quoted_table} DROP CONSTRAINT {check}"))
+
+def migrate(batch_size: int = 1000) -> int:
+    """Migrate every legacy string column still present in the database; returns how many"""
+    print("🔧 Migrating legacy string columns...")
+    print("-" * 50)
+
+    with engine.connect() as connection:
+        pending = pending_columns(connection)
+    for model_table, name, target, converter in pending:
+        migrate_column(model_table, name, target, converter, batch_size)
+    if pending and engine.dialect.name == "sqlite":
+        by_table = {}
+        for model_table, name, _, _ in pending:
+            by_table.setdefault(model_table, []).append(name)
+        for model_table, names in by_table.items():
+            enforce_not_null_sqlite(model_table, names)
+
+    if pending:
+        migrate_indexes.main()
+    print("-" * 50)
+    print(f"✅ {len(pending)} column(s) migrated" if pending else "✅ All columns already use native types")
+    return len(pending)
+
+def enforce_not_null_sqlite(model_table, names):
+    """SQLite can't alter a column in place: rebuild the table once with the model's NOT NULL and defaults"""
+    with engine.begin() as connection:
+        operations = Operations(MigrationContext.configure(connection))
+        with operations.batch_alter_table(model_table.name, recreate="always") as batch:
+            for name in names:
+                column_obj = model_table.c[name]
+                batch.alter_column(name, nullable=column_obj.nullable, server_default=column_obj.server_default.arg)
+        if connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+        ).first():
+            # The rebuild drops the table's search triggers
+            create_fts_index(connection)
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate legacy string timestamp/flag columns to native types")
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per backfill transaction (default: 1000)")
+    args = parser.parse_args()
+    migrate(args.batch_size)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Rebuild the tag tables (tags, project_tags, experience_tags) from the JSON
+`tags` columns of projects and experiences. The API keeps them in sync on
+every write; run this after editing tags with raw SQL. scripts/migrate.py
+creates the tables and runs it for a database created before tag indexing.
+
+Run with: python -m scripts.rebuild_tags
+Or: python scripts/rebuild_tags.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+from app.core.database import SessionLocal
+from app.core.tags import rebuild_tags
+from app.models import project_tags, experience_tags
+
+def main():
+    """Rebuild every tag link in one transaction"""
+    print("🏷️  Rebuilding tag index...")
+    print("-" * 50)
+
+    db = SessionLocal()
+    try:
+        rebuild_tags(db)
+        db.commit()
+        for table in (project_tags, experience_tags):
+            print(f"✓ {db.scalar(select(func.count()).select_from(table))} links in {table.name}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error rebuilding tags: {e}")
+        raise
+    finally:
+        db.close()
+
+    print("-" * 50)
+    print("✅ Tag index rebuilt")
+
+if __name__ == "__main__":
+    main()
@@ -11,16 +11,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal, engine, Base
+from app.core.database import SessionLocal
+from app.core.tags import rebuild_tags
 from app.models import (
     Project, Experience, Skill, SkillCategory, 
     Contact, About, Stat, SocialLink
 )
-from datetime import datetime
+from datetime import datetime, timezone
+from scripts import migrate
 
 def get_timestamp():
-    """Get current timestamp as string"""
-    return datetime.now().isoformat()
+    """Get current UTC timestamp"""
+    return datetime.now(timezone.utc)
 
 def seed_projects(db: Session):
     """Seed projects table"""
@@ -32,7 +34,7 @@ def seed_projects(db: Session):
             "tags": ["Next.js", "React", "TypeScript", "WebSocket"],
             "live_url": None,
             "github_url": "https://github.com/zakariabidouli/transcendence",
-            "featured": "true",
+            "featured": True,
             "order_index": 0
         },
         {
@@ -42,7 +44,7 @@ def seed_projects(db: Session):
             "tags": ["C++", "HTTP", "Networking", "Concurrency"],
             "live_url": None,
             "github_url": "https://github.com/zakariabidouli/webserv",
-            "featured": "true",
+            "featured": True,
             "order_index": 1
         },
         {
@@ -52,7 +54,7 @@ def seed_projects(db: Session):
             "tags": ["Spring Boot", "PostgreSQL", "Vaadin", "Docker"],
             "live_url": None,
             "github_url": None,
-            "featured": "true",
+            "featured": True,
             "order_index": 2
         },
         {
@@ -62,7 +64,7 @@ def seed_projects(db: Session):
             "tags": ["Python", "PostgreSQL", "Data Visualization"],
             "live_url": None,
             "github_url": None,
-            "featured": "true",
+            "featured": True,
             "order_index": 3
         }
     ]
@@ -249,8 +251,8 @@ def main():
     print("🌱 Starting database seeding...")
     print("-" * 50)
     
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # Create or upgrade the schema
+    migrate.main()
     
     db = SessionLocal()
     try:
@@ -276,6 +278,10 @@ def main():
         seed_social_links(db)
         seed_contacts(db)
         
+        db.flush()
+        rebuild_tags(db)
+        print("✓ Indexed project and experience tags")
+        
         db.commit()
         print("-" * 50)
         print("✅ Database seeding completed successfully!")
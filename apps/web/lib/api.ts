@@ -92,6 +92,15 @@ export interface SocialLink {
   updated_at?: string | null
 }
 
+export interface Portfolio {
+  projects: Project[]
+  experiences: Experience[]
+  skill_categories: SkillCategory[]
+  about: About[]
+  stats: Stat[]
+  social_links: SocialLink[]
+}
+
 // API Client
 class ApiClient {
   private baseUrl: string
@@ -132,11 +141,20 @@ class ApiClient {
     }
   }
 
+  // Portfolio (every public collection in one request)
+  async getPortfolio(): Promise<Portfolio> {
+    return this.fetch<Portfolio>('/portfolio/')
+  }
+
   // Projects
   async getProjects(): Promise<Project[]> {
     return this.fetch<Project[]>('/projects/')
   }
 
+  async getFeaturedProjects(): Promise<Project[]> {
+    return this.fetch<Project[]>('/projects/featured')
+  }
+
   async createProject(data: Omit<Project, 'id' | 'created_at' | 'updated_at'>): Promise<Project> {
     return this.fetch<Project>('/projects/', {
       method: 'POST',